@@ -2,31 +2,86 @@ import logging
 from pathlib import Path
 from Settings import getSettings
 import shutil
-from datetime import datetime
+import time
+import os
+import sys
+import errno
 
 log = logging.getLogger(__name__)
 settings = None
 
+# Canonical master input directory (and its normcased prefix) and skip/fail directories,
+# computed once in loadSettings()
+_inputKey = None
+_inputPrefix = None
+_skipDir = None
+_failDir = None
+
 # Marker file name for failed books
 FAIL_MARKER_FILE = "ultimate-audiobook-fail.txt"
 
-# Track all skipped and failed books
-_skips = []
-_fails = []
-
-# Map current paths to original paths (for items moved to temp folders)
+# Output extensions checked by checkOutputExists, in priority order
+_OUTPUT_EXTENSIONS = ('.m4b', '.mp3', '.m4a', '.flac', '.wav')
+_M4B_OUTPUT_EXTENSIONS = ('.m4b',)
+_OUTPUT_EXTENSION_SETS = {
+    _OUTPUT_EXTENSIONS: frozenset(_OUTPUT_EXTENSIONS),
+    _M4B_OUTPUT_EXTENSIONS: frozenset(_M4B_OUTPUT_EXTENSIONS),
+}
+
+# Static sections of the fail marker file
+_REASON_PREFIX = "\nReason:"
+_FAIL_MARKER_HEADER = "ULTIMATE AUDIOBOOKS - MANUAL REVIEW REQUIRED\n" + "=" * 44 + "\n\n"
+_FAIL_MARKER_SUGGESTION = (
+    "Suggested fix:\n"
+    "  - Review the files in this folder\n"
+    "  - Fix any issues (remove duplicates, rename files, etc.)\n"
+    "  - Delete this .fail file to retry processing\n\n"
+)
+_FAIL_MARKER_TIMESTAMP = "Detected: %Y-%m-%d %H:%M:%S\n"
+
+# Track all skipped and failed books (canonical path string -> original Path, insertion-ordered)
+_skips = {}
+_fails = {}
+
+# Map current path strings to original path strings (for items moved to temp folders)
 _originalPaths = {}
 
 # Track files that were merged from multiple chapters (should always convert to m4b)
+# Stores canonical path strings
 _mergedFromChapters = set()
 
 # Temp folder name constant
 TEMP_FOLDER_NAME = "Ultimate temp"
 
+# Destination directories already created by _moveItem
+_ensuredDirs = set()
+
+# Give up on a move after this many " - N" name conflicts
+_MAX_NAME_CONFLICTS = 10000
+
+# Fail marker lookups keyed by folder path string: existence and parsed reason
+_failMarkerCache = {}
+_failReasonCache = {}
+
+def _canonKey(p):
+    """
+    Canonical lookup key (absolute path string) using pure string ops (no syscalls).
+    Keys are interned so repeated paths share memory and compare by identity.
+    """
+    return sys.intern(os.path.normpath(os.path.abspath(os.fspath(p))))
+
+# Path fragments identifying the temp folder (TEMP_FOLDER_NAME contains no separators)
+_tempFolderSeps = [sep for sep in (os.sep, os.altsep) if sep]
+_tempFolderInner = [f"{sep}{TEMP_FOLDER_NAME}{sep}" for sep in _tempFolderSeps]
+_tempFolderHead = tuple(f"{TEMP_FOLDER_NAME}{sep}" for sep in _tempFolderSeps)
+_tempFolderTail = tuple(f"{sep}{TEMP_FOLDER_NAME}" for sep in _tempFolderSeps)
+
 def _isInTempFolder(item):
     """Check if an item is in the Ultimate temp folder."""
-    item = Path(item)
-    return TEMP_FOLDER_NAME in item.parts
+    s = os.fspath(item)
+    if s == TEMP_FOLDER_NAME or s.startswith(_tempFolderHead) or s.endswith(_tempFolderTail):
+        return True
+    return any(fragment in s for fragment in _tempFolderInner)
 
 def _deleteTempFile(item):
     """Delete a file if it's in the temp folder."""
@@ -35,16 +90,22 @@ def _deleteTempFile(item):
         try:
             if item.is_file():
                 item.unlink()
-                log.debug(f"Deleted temp file: {item.name}")
+                log.debug("Deleted temp file: %s", item.name)
             elif item.is_dir():
                 shutil.rmtree(item)
-                log.debug(f"Deleted temp folder: {item.name}")
+                log.debug("Deleted temp folder: %s", item.name)
         except Exception as e:
-            log.warning(f"Failed to delete temp item {item.name}: {e}")
+            log.warning("Failed to delete temp item %s: %s", item.name, e)
 
 def loadSettings():
-    global settings
+    global settings, _inputKey, _inputPrefix, _skipDir, _failDir
     settings = getSettings()
+    if settings:
+        _inputKey = _canonKey(settings.input)
+        _inputPrefix = os.path.join(os.path.normcase(_inputKey), '')
+        inParent = Path(settings.input).parent
+        _skipDir = inParent / "Ultimate Audiobook skips"
+        _failDir = inParent / "Ultimate Audiobook fails"
 
 def setOriginalPath(currentPath, originalPath):
     """
@@ -54,10 +115,8 @@ def setOriginalPath(currentPath, originalPath):
         currentPath: Current path of the item (may be in temp folder)
         originalPath: Original path of the item (before moving to temp)
     """
-    # Resolve to absolute paths for consistent lookups
-    current = Path(currentPath).resolve()
-    original = Path(originalPath).resolve()
-    _originalPaths[current] = original
+    # Canonical absolute keys for consistent lookups
+    _originalPaths[_canonKey(currentPath)] = _canonKey(originalPath)
 
 def getOriginalPath(currentPath):
     """
@@ -69,8 +128,8 @@ def getOriginalPath(currentPath):
     Returns:
         Original path if found, otherwise None
     """
-    current = Path(currentPath).resolve()
-    return _originalPaths.get(current)
+    original = _originalPaths.get(_canonKey(currentPath))
+    return Path(original) if original is not None else None
 
 
 def setMergedFromChapters(filePath):
@@ -81,9 +140,9 @@ def setMergedFromChapters(filePath):
     Args:
         filePath: Path to the merged file
     """
-    resolved = Path(filePath).resolve()
-    _mergedFromChapters.add(resolved)
-    log.debug(f"Marked as merged from chapters: {resolved.name}")
+    key = _canonKey(filePath)
+    _mergedFromChapters.add(key)
+    log.debug("Marked as merged from chapters: %s", os.path.basename(key))
 
 
 def isMergedFromChapters(filePath):
@@ -96,8 +155,7 @@ def isMergedFromChapters(filePath):
     Returns:
         True if file was merged from chapters, False otherwise
     """
-    resolved = Path(filePath).resolve()
-    return resolved in _mergedFromChapters
+    return _canonKey(filePath) in _mergedFromChapters
 
 def _getRelativePath(item):
     """
@@ -107,39 +165,37 @@ def _getRelativePath(item):
     """
     if settings is None:
         loadSettings()
-    
-    item = Path(item).resolve()
-    
+
     # Check if we have an original path for this item (e.g., moved to temp)
-    if item in _originalPaths:
-        item = _originalPaths[item]
-    
-    try:
-        # Get relative path from master input directory
-        masterInput = Path(settings.input).resolve()
-        relPath = item.relative_to(masterInput)
-        relPathStr = str(relPath).replace('\\', '/')
-        # If the relative path is "." (item is the input dir), use the folder name
-        if relPathStr == ".":
-            return item.name
-        return relPathStr
-    except ValueError:
-        # Item is not under master input directory, just return the name
-        return item.name
+    key = _canonKey(item)
+    key = _originalPaths.get(key, key)
+
+    # Prefix test on canonical strings instead of Path.relative_to
+    # If the item is the input dir itself, use the folder name
+    cmpKey = os.path.normcase(key)
+    if _inputKey and cmpKey.startswith(_inputPrefix):
+        return key[len(_inputPrefix):].replace('\\', '/')
+
+    # Item is not under master input directory, just return the name
+    return os.path.basename(key)
 
 def _getSkipDir():
     """Get the skip directory path (does not create it)."""
     if settings is None:
         loadSettings()
-    infolder = Path(settings.input)
-    return infolder.parent.joinpath("Ultimate Audiobook skips")
+    return _skipDir
 
 def _getFailDir():
     """Get the fail directory path (does not create it)."""
     if settings is None:
         loadSettings()
-    infolder = Path(settings.input)
-    return infolder.parent.joinpath("Ultimate Audiobook fails")
+    return _failDir
+
+
+def _markerFolder(folderPath):
+    """Folder (as a normalized string) that holds the fail marker for a file or folder path."""
+    folder = os.path.normpath(os.fspath(folderPath))
+    return folder if os.path.isdir(folder) else os.path.dirname(folder)
 
 
 def _createFailMarker(folderPath, reason=None, files=None):
@@ -151,36 +207,28 @@ def _createFailMarker(folderPath, reason=None, files=None):
         reason: Reason for the failure
         files: Optional list of files found in the folder
     """
-    folderPath = Path(folderPath)
-    if not folderPath.is_dir():
-        folderPath = folderPath.parent
+    folder = _markerFolder(folderPath)
+    markerPath = os.path.join(folder, FAIL_MARKER_FILE)
 
-    markerPath = folderPath / FAIL_MARKER_FILE
+    # Build the whole marker in memory and write it once
+    parts = [_FAIL_MARKER_HEADER]
+    if reason:
+        parts.append(f"Reason: {reason}\n\n")
+    if files:
+        parts.append("Found files:\n")
+        parts.append("\n".join(f"  - {Path(file).name}" for file in files))
+        parts.append("\n\n")
+    parts.append(_FAIL_MARKER_SUGGESTION)
+    parts.append(time.strftime(_FAIL_MARKER_TIMESTAMP))
 
     try:
         with open(markerPath, 'w', encoding='utf-8') as f:
-            f.write("ULTIMATE AUDIOBOOKS - MANUAL REVIEW REQUIRED\n")
-            f.write("=" * 44 + "\n\n")
-
-            if reason:
-                f.write(f"Reason: {reason}\n\n")
-
-            if files:
-                f.write("Found files:\n")
-                for file in files:
-                    f.write(f"  - {Path(file).name}\n")
-                f.write("\n")
-
-            f.write("Suggested fix:\n")
-            f.write("  - Review the files in this folder\n")
-            f.write("  - Fix any issues (remove duplicates, rename files, etc.)\n")
-            f.write("  - Delete this .fail file to retry processing\n\n")
-
-            f.write(f"Detected: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-
-        log.debug(f"Created fail marker: {markerPath}")
+            f.write("".join(parts))
+        _failMarkerCache[folder] = True
+        _failReasonCache.pop(folder, None)
+        log.debug("Created fail marker: %s", markerPath)
     except Exception as e:
-        log.warning(f"Failed to create fail marker file: {e}")
+        log.warning("Failed to create fail marker file: %s", e)
 
 
 def hasFailMarker(folderPath):
@@ -193,12 +241,12 @@ def hasFailMarker(folderPath):
     Returns:
         True if fail marker exists, False otherwise
     """
-    folderPath = Path(folderPath)
-    if not folderPath.is_dir():
-        folderPath = folderPath.parent
-
-    markerPath = folderPath / FAIL_MARKER_FILE
-    return markerPath.exists()
+    folder = _markerFolder(folderPath)
+    exists = _failMarkerCache.get(folder)
+    if exists is None:
+        exists = os.path.isfile(os.path.join(folder, FAIL_MARKER_FILE))
+        _failMarkerCache[folder] = exists
+    return exists
 
 
 def getFailMarkerReason(folderPath):
@@ -211,26 +259,49 @@ def getFailMarkerReason(folderPath):
     Returns:
         Reason string if found, None otherwise
     """
-    folderPath = Path(folderPath)
-    if not folderPath.is_dir():
-        folderPath = folderPath.parent
-
-    markerPath = folderPath / FAIL_MARKER_FILE
-    if not markerPath.exists():
+    folder = _markerFolder(folderPath)
+    if not hasFailMarker(folder):
         return None
 
+    if folder in _failReasonCache:
+        return _failReasonCache[folder]
+
+    reason = "Unknown (fail marker exists)"
     try:
-        with open(markerPath, 'r', encoding='utf-8') as f:
-            for line in f:
-                if line.startswith("Reason:"):
-                    return line[7:].strip()
+        # Marker files are tiny - read once and locate the reason line directly
+        with open(os.path.join(folder, FAIL_MARKER_FILE), 'r', encoding='utf-8', errors='replace') as f:
+            data = "\n" + f.read()
+        start = data.find(_REASON_PREFIX)
+        if start >= 0:
+            start += len(_REASON_PREFIX)
+            end = data.find("\n", start)
+            reason = data[start:end if end >= 0 else len(data)].strip()
     except Exception:
         pass
 
-    return "Unknown (fail marker exists)"
+    _failReasonCache[folder] = reason
+    return reason
+
 
+def clearFailMarkerCache():
+    """Forget cached fail marker lookups (call at the start of each batch so deleted markers are noticed)."""
+    _failMarkerCache.clear()
+    _failReasonCache.clear()
 
-def checkOutputExists(outputFolder, title, requireM4B=False):
+
+def listOutputFolder(outputFolder):
+    """
+    Names of everything in an output folder from a single scandir, or () if it doesn't exist.
+    Lets callers run checkOutputExists and their own "does X already exist" checks off one listing.
+    """
+    try:
+        with os.scandir(outputFolder) as it:
+            return tuple(entry.name for entry in it)
+    except (FileNotFoundError, NotADirectoryError):
+        return ()
+
+
+def checkOutputExists(outputFolder, title, requireM4B=False, names=None):
     """
     Check if an output file already exists for this book.
     Looks for .m4b, .mp3, .m4a files matching the title.
@@ -239,35 +310,43 @@ def checkOutputExists(outputFolder, title, requireM4B=False):
         outputFolder: Path to the output folder (e.g., output/Author/Title)
         title: The book title to check for
         requireM4B: If True, only .m4b files count as existing output (for -CV mode)
+        names: Optional listOutputFolder(outputFolder) result to check instead of scanning again
 
     Returns:
         Path to existing file if found, None otherwise
     """
     outputFolder = Path(outputFolder)
-    if not outputFolder.exists():
-        return None
+    if names is None:
+        names = listOutputFolder(outputFolder)
 
     # Clean the title for filename matching
+    # Imported here: Util imports BookStatus at module level, so a top-level import would be circular
     from Util import cleanTitleForPath
     cleanTitle = cleanTitleForPath(title) if title else None
 
-    # Check for common audiobook extensions
+    # Check for common audiobook extensions, in priority order
     # If requireM4B is set, only accept .m4b as valid output
-    if requireM4B:
-        extensions = ['.m4b']
-    else:
-        extensions = ['.m4b', '.mp3', '.m4a', '.flac', '.wav']
+    extensions = _M4B_OUTPUT_EXTENSIONS if requireM4B else _OUTPUT_EXTENSIONS
+    extSet = _OUTPUT_EXTENSION_SETS[extensions]
+
+    # One pass over the listing, remembering the exact title match and first file per extension
+    exactMatches = {}
+    firstMatches = {}
+    for name in names:
+        dot = name.rfind('.')
+        if dot < 0:
+            continue
+        ext = name[dot:].lower()
+        if ext not in extSet:
+            continue
+        if cleanTitle and name[:dot] == cleanTitle:
+            exactMatches.setdefault(ext, name)
+        firstMatches.setdefault(ext, name)
 
     for ext in extensions:
-        # Check exact title match
-        if cleanTitle:
-            exactPath = outputFolder / f"{cleanTitle}{ext}"
-            if exactPath.exists():
-                return exactPath
-
-        # Check for any audiobook file in the folder
-        for audioFile in outputFolder.glob(f"*{ext}"):
-            return audioFile
+        match = exactMatches.get(ext) or firstMatches.get(ext)
+        if match:
+            return outputFolder / match
 
     return None
 
@@ -283,35 +362,45 @@ def _moveItem(item, destDir, itemType="book"):
     """
     item = Path(item)
     if not item.exists():
-        log.warning(f"{itemType.capitalize()} no longer exists, cannot move: {item.name}")
+        log.warning("%s no longer exists, cannot move: %s", itemType.capitalize(), item.name)
         return False
     
-    # Create destination directory only when needed
-    destDir.mkdir(exist_ok=True)
+    # Create destination directory only when needed (once per run)
+    dirKey = str(destDir)
+    if dirKey not in _ensuredDirs:
+        destDir.mkdir(exist_ok=True)
+        _ensuredDirs.add(dirKey)
     dest = destDir / item.name
     
-    # Handle name conflicts
+    # Handle name conflicts (lexists avoids following symlinks)
+    isDir = item.is_dir()
     counter = 1
-    original_dest = dest
-    while dest.exists():
-        if item.is_dir():
+    while os.path.lexists(dest):
+        if counter > _MAX_NAME_CONFLICTS:
+            log.error("Too many name conflicts moving %s %s to %s", itemType, item.name, destDir)
+            return False
+        if isDir:
             dest = destDir / f"{item.name} - {counter}"
         else:
-            stem = item.stem
-            suffix = item.suffix
-            dest = destDir / f"{stem} - {counter}{suffix}"
+            dest = destDir / f"{item.stem} - {counter}{item.suffix}"
         counter += 1
     
     try:
-        if item.is_dir():
+        try:
+            # Same-device moves are a single rename syscall
+            os.replace(item, dest)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            # Cross-device: fall back to copy + delete
             shutil.move(str(item), str(dest))
-            log.info(f"Moved {itemType} folder: {item.name} -> {dest.name}")
+        if isDir:
+            log.info("Moved %s folder: %s -> %s", itemType, item.name, dest.name)
         else:
-            item.rename(dest)
-            log.info(f"Moved {itemType} file: {item.name} -> {dest.name}")
+            log.info("Moved %s file: %s -> %s", itemType, item.name, dest.name)
         return True
     except Exception as e:
-        log.error(f"Error moving {itemType} {item.name}: {e}")
+        log.error("Error moving %s %s: %s", itemType, item.name, e)
         return False
 
 def skipBook(item, reason=None):
@@ -327,22 +416,24 @@ def skipBook(item, reason=None):
     """
     item = Path(item)
 
+    # Use original path for skip list tracking, not temp path
+    originalItem = Path(_originalPaths.get(_canonKey(item), item))
+    key = _canonKey(originalItem)
+
     # Avoid duplicates
-    if item in _skips:
-        log.debug(f"Book already in skip list: {item.name}")
+    if key in _skips:
+        log.debug("Book already in skip list: %s", item.name)
         return
 
-    # Use original path for skip list tracking, not temp path
-    originalItem = _originalPaths.get(item.resolve(), item)
-    _skips.append(originalItem)
+    _skips[key] = originalItem
 
     # Format: "Skipping (reason): title" - short and clear
     relPath = _getRelativePath(originalItem)
     title = originalItem.stem if originalItem.is_file() else originalItem.name
     if reason:
-        log.info(f"Skipping ({reason}): \"{title}\"")
+        log.info("Skipping (%s): \"%s\"", reason, title)
     else:
-        log.info(f"Skipping: \"{relPath}\"")
+        log.info("Skipping: \"%s\"", relPath)
 
     # Always delete temp files - they're just intermediate artifacts
     _deleteTempFile(item)
@@ -368,18 +459,19 @@ def failBook(item, reason=None, files=None):
     item = Path(item)
 
     # Get original path if item was moved to temp folder
-    originalItem = _originalPaths.get(item.resolve(), item)
+    originalItem = Path(_originalPaths.get(_canonKey(item), item))
+    key = _canonKey(originalItem)
 
     # Avoid duplicates
-    if originalItem in _fails:
-        log.debug(f"Book already in fail list: {originalItem.name}")
+    if key in _fails:
+        log.debug("Book already in fail list: %s", originalItem.name)
         return
 
-    _fails.append(originalItem)
+    _fails[key] = originalItem
 
     reason_msg = f" - {reason}" if reason else ""
     relPath = _getRelativePath(originalItem)
-    log.error(f"Failed book: \"{relPath}\"{reason_msg}")
+    log.error("Failed book: \"%s\"%s", relPath, reason_msg)
 
     # Create fail marker in the original source folder
     _createFailMarker(originalItem, reason, files)
@@ -394,11 +486,11 @@ def failBook(item, reason=None, files=None):
 
 def getSkips():
     """Get a copy of the skip list."""
-    return _skips.copy()
+    return list(_skips.values())
 
 def getFails():
     """Get a copy of the fail list."""
-    return _fails.copy()
+    return list(_fails.values())
 
 def getSkipCount():
     """Get the number of skipped books."""
@@ -411,31 +503,29 @@ def getFailCount():
 def clearSkips():
     """Clear the skip list (for testing/reset)."""
     _skips.clear()
+    _ensuredDirs.clear()
 
 def clearFails():
     """Clear the fail list (for testing/reset)."""
     _fails.clear()
+    _ensuredDirs.clear()
 
 def printSummary():
     """Print a summary of all skipped and failed books at the end."""
     if len(_skips) == 0 and len(_fails) == 0:
         log.info("No books were skipped or failed.")
         return
-    
-    log.info("=" * 60)
-    log.info("SKIP/FAIL SUMMARY")
-    log.info("=" * 60)
-    
+
+    # Build the whole summary and emit it as a single log record
+    lines = ["=" * 60, "SKIP/FAIL SUMMARY", "=" * 60]
+
     if len(_skips) > 0:
-        log.info(f"\nSkipped books ({len(_skips)}):")
-        for item in _skips:
-            relPath = _getRelativePath(item)
-            log.info(f"  - {relPath}")
-    
+        lines.append(f"\nSkipped books ({len(_skips)}):")
+        lines.extend(f"  - {_getRelativePath(item)}" for item in _skips.values())
+
     if len(_fails) > 0:
-        log.info(f"\nFailed books ({len(_fails)}):")
-        for item in _fails:
-            relPath = _getRelativePath(item)
-            log.info(f"  - {relPath}")
-    
-    log.info("=" * 60)
+        lines.append(f"\nFailed books ({len(_fails)}):")
+        lines.extend(f"  - {_getRelativePath(item)}" for item in _fails.values())
+
+    lines.append("=" * 60)
+    log.info("\n".join(lines))
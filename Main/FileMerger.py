@@ -1,37 +1,98 @@
 from Settings import getSettings
 from itertools import islice
 import mutagen
+from mutagen.mp4 import MP4, MP4Cover
+from mutagen.mp3 import MP3
+from mutagen.id3 import APIC
 import re
+import io
 import subprocess
 import logging
 import tempfile
 from pathlib import Path
 import os
 import shutil
-from Util import sanitizeFile, getAudioFiles, cleanAuthorForPath, cleanTitleForPath
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from collections import defaultdict
+from Util import sanitizeFile, getAudioFiles, getAudioFilesFromEntries, cleanAuthorForPath, cleanTitleForPath, bookOutputPath
 from BookStatus import skipBook, failBook, setOriginalPath, hasFailMarker, getFailMarkerReason, checkOutputExists, setMergedFromChapters
 
+# mutagen-rs - optional, faster read-only drop-in used for chapter metadata reads
+# Writes (tags, cover art) always go through stock mutagen
+try:
+    import mutagen_rs as mutagen_fast
+    MUTAGEN_RS_AVAILABLE = True
+except ImportError:
+    mutagen_fast = mutagen
+    MUTAGEN_RS_AVAILABLE = False
+
+# natsort - optional, C-accelerated natural sort keys for the alphabetical ordering fallback
+# Falls back to the pure-Python _naturalKey below
+try:
+    from natsort import natsort_keygen, ns
+    _natsortKey = natsort_keygen(alg=ns.IGNORECASE | ns.PATH)
+    NATSORT_AVAILABLE = True
+except ImportError:
+    _natsortKey = None
+    NATSORT_AVAILABLE = False
+
 log = logging.getLogger(__name__)
 settings = None
 
+# Precompiled patterns for chapter ordering and duplicate version detection
+_DIGIT_RE = re.compile(r'\d+')
+_ALPHANUM_RE = re.compile(r'(\d+)([A-Z])?')
+_NATURAL_SPLIT_RE = re.compile(r'(\d+)')
+_INTRO_RE = re.compile(r'INTRO|PROLOGUE')
+_OUTRO_RE = re.compile(r'OUTRO|EPILOGUE|CREDITS')
+_MP4_EXTS = ('.m4a', '.m4b', '.mp4')
+
+# Multi-disc folder detection for findBooks
+_NUM_ONLY_RE = re.compile(r'^\d+$')
+_BASE_NUM_RE = re.compile(r'^(.+?)[\s_-]*[\[\(]?(?:cd|disc|disk|part|volume|vol)?[\s_-]*(\d+)[\]\)]?\s*$', re.IGNORECASE)
+_TRAIL_SEP_RE = re.compile(r'[\s_,-]+$')
+_NON_WORD_RE = re.compile(r'[^\w\s]')
+_CD_FOLDER_RE = re.compile(r'^(cd|disc|disk)\s*[-_]?\s*(\d+)$', re.IGNORECASE)
+
+# Tags carried over from the first chapter file to the merged book
+# 'title' is excluded - in chapter files it's the chapter title, not the book title
+_KEEP_TAGS = ('artist', 'albumartist', 'album', 'date', 'genre')
+
+# Filename pattern classes for detectDuplicateVersions, in priority order. Each
+# alternative is a lookahead tried from the start of the name, so the first class
+# that matches anywhere wins (not the leftmost match), and lastgroup names it.
+_PATTERN_UNION = re.compile(
+    r'^(?:'
+    r'(?P<n_of_m>(?=.*?\(\d+\s*of\s*\d+\)))'
+    r'|(?P<part_suffix>(?=.*?-Part\d+))'
+    r'|(?P<part_word>(?=.*?\sPart\s*\d+))'
+    r'|(?P<dash_separator>(?=.*? - )(?=.*?\d+\s*-\s*))'
+    r'|(?P<numbered_prefix>(?=\d+\s))'
+    r')',
+    re.IGNORECASE)
+
 def loadSettings():
     global settings
     settings = getSettings()
 
+def _keywordTitleNum(upperTitle, whichNum) -> int:
+    """Fallback title key for a title with no number at whichNum: intro first, outro last, else -1."""
+    if _INTRO_RE.search(upperTitle):
+        log.debug("Intro or prologue detected. Setting as first element in trackmap.")
+        return 0
+    if _OUTRO_RE.search(upperTitle):
+        log.debug("Outro, epilogue, or credits detected. Setting as last element in trackmap.")
+        return 999
+    log.debug("Failed to find keyword or number in title on numberPosition " + str(whichNum))
+    return -1   #no more numbers in title
+
 def findTitleNum(title, whichNum) -> int:
     title = title.upper()
-    try:
-        return int(re.findall(r'\d+', title)[whichNum])  #find all numbers, return specified
-    except IndexError:
-        if any(word in title for word in ["intro".upper(), "prologue".upper()]):
-            log.debug("Intro or prologue detected. Setting as first element in trackmap.")
-            return 0
-        if any(word in title for word in ["outro".upper(), "epilogue".upper(), "credits".upper()]):
-            log.debug("Outro, epilogue, or credits detected. Setting as last element in trackmap.")
-            return 999
-        else:
-            log.debug("Failed to find keyword or number in title on numberPosition " + str(whichNum))
-            return -1   #no more numbers in title
+    nums = _DIGIT_RE.findall(title)  #find all numbers, return specified
+    if whichNum < len(nums):
+        return int(nums[whichNum])
+    return _keywordTitleNum(title, whichNum)
 
 
 def findAlphanumericKey(title, whichNum):
@@ -42,7 +103,7 @@ def findAlphanumericKey(title, whichNum):
     """
     title = title.upper()
     # Find patterns like '01a', '12b', '05' (number optionally followed by letter)
-    matches = re.findall(r'(\d+)([A-Z])?', title)
+    matches = _ALPHANUM_RE.findall(title)
 
     if whichNum < len(matches):
         num_str, letter = matches[whichNum]
@@ -50,42 +111,54 @@ def findAlphanumericKey(title, whichNum):
         letter = letter if letter else ''
         return (num, letter)
 
-    # Check for special keywords
-    if any(word in title for word in ["INTRO", "PROLOGUE"]):
+    return _keywordAlphanumericKey(title)
+
+
+def _keywordAlphanumericKey(upperTitle):
+    """Fallback alphanumeric key from intro/outro keywords, or None."""
+    if _INTRO_RE.search(upperTitle):
         log.debug("Intro or prologue detected. Setting as first element.")
         return (0, '')
-    if any(word in title for word in ["OUTRO", "EPILOGUE", "CREDITS"]):
+    if _OUTRO_RE.search(upperTitle):
         log.debug("Outro, epilogue, or credits detected. Setting as last element.")
         return (999, 'ZZZ')
 
     return None
 
 
+def _naturalKey(name):
+    """Natural sort key: 'Chapter 2' sorts before 'Chapter 10', case-insensitively."""
+    parts = _NATURAL_SPLIT_RE.split(name.lower())
+    # Split on a capturing group alternates text/number, so odd indexes are always digits
+    return tuple(int(part) if i % 2 else part for i, part in enumerate(parts))
+
+
+# Natural sort key for filenames - natsort's when installed, otherwise _naturalKey
+naturalSortKey = _natsortKey or _naturalKey
+
+
 def orderByTrackNumber(tracks, hasMultipleDisks):
     log.debug(f"Attempting to order files by track number... hasMultipleDisks={hasMultipleDisks}, numTracks={len(tracks)}")
-    chapters = [None] * (len(tracks) + 1)
+    chapters = {}   # track position -> track, so sparse numbering leaves no holes
 
     try:
         if hasMultipleDisks:
             log.debug("Processing multiple disks...")
-            tracksDone = 0
-            disk = 1
-            maxDisk = 10  # Safety limit to prevent infinite loop
-            while tracksDone < len(tracks) and disk <= maxDisk:
-                offset = tracksDone
-                log.debug(f"Processing disk {disk}, tracksDone={tracksDone}")
-                for track in tracks:
-                    log.debug(f"Checking track for disk {disk}...")
-                    diskNumber = int(track['discnumber'][0])
+            # Bucket tracks by disk in one pass, then lay disks out in order
+            disks = defaultdict(list)
+            for track in tracks:
+                disks[int(track['discnumber'][0])].append(track)
+            offset = 0
+            for disk in sorted(disks):
+                diskTracks = disks[disk]
+                log.debug(f"Processing disk {disk}, tracksDone={offset}")
+                for track in diskTracks:
                     trackNumber = int(track['tracknumber'][0].split('/')[0])
-
-                    if diskNumber == disk:
-                        chapters[trackNumber + offset] = track
-                        tracksDone += 1
-                disk += 1
-            if disk > maxDisk:
-                log.debug("Hit max disk limit, aborting")
-                return []
+                    if trackNumber + offset in chapters:
+                        log.debug("Overlapping track numbers detected. Aborting track number sort.")
+                        return []
+                    chapters[trackNumber + offset] = track
+                offset += len(diskTracks)
         else:
             log.debug("Processing single disk...")
             for i, track in enumerate(tracks):
@@ -95,21 +168,14 @@ def orderByTrackNumber(tracks, hasMultipleDisks):
                     return []
                 trackNumber = int(track['tracknumber'][0].split('/')[0])
                 log.debug(f"Track {i+1} has tracknumber={trackNumber}")
-                if chapters[trackNumber] == None:
-                    chapters[trackNumber] = track
-                else:
+                if trackNumber in chapters:
                     log.debug("Overlapping track numbers detected. Aborting track number sort.")
                     return []
+                chapters[trackNumber] = track
             log.debug("All tracks processed successfully")
 
-        if chapters[0] == None:
-            chapters = chapters[1:]
-
-        if chapters[-1] == None:
-            chapters = chapters[:-1]
-
         log.debug(f"Ordered {len(chapters)} chapters by track number")
-        return chapters
+        return [chapters[position] for position in sorted(chapters)]
     except (KeyError, IndexError, ValueError) as e:
         log.debug(f"Track number ordering failed: {e}")
         return []
@@ -118,8 +184,11 @@ def orderByTrackNumber(tracks, hasMultipleDisks):
 def orderByTitle(tracks, folderPath=None):
     log.debug("Attempting to order files by name...")
 
+    # Parse filenames once - the retry loops below reuse them on every attempt
+    stems = [Path(t.filename).stem for t in tracks]
+
     # First try alphanumeric ordering (handles '01a', '01b', '02a' patterns)
-    result = orderByTitleAlphanumeric(tracks, folderPath)
+    result = orderByTitleAlphanumeric(tracks, folderPath, stems)
     if result:
         return result
 
@@ -128,10 +197,17 @@ def orderByTitle(tracks, folderPath=None):
     whichNum = 0
     maxNumericAttempts = 5  # Prevent infinite loops
 
+    # findTitleNum() inlined: uppercase and split out the numbers once per track
+    upperStems = [stem.upper() for stem in stems]
+    stemNums = [_DIGIT_RE.findall(up) for up in upperStems]
+
     while whichNum < maxNumericAttempts:
         trackMap = {}
-        for track in tracks:
-            key = findTitleNum(Path(track.filename).stem, whichNum)
+        for track, up, nums in zip(tracks, upperStems, stemNums):
+            if whichNum < len(nums):
+                key = int(nums[whichNum])
+            else:
+                key = _keywordTitleNum(up, whichNum)
             if key in trackMap and key != -1:
                 log.debug("Duplicate track numbers detected at position " + str(whichNum))
                 trackMap = {999:"error"}
@@ -152,12 +228,14 @@ def orderByTitle(tracks, folderPath=None):
                 tracksOut.append(trackMap[key])
             return tracksOut
 
-    # Final fallback: simple alphabetical sort by filename
+    # Final fallback: natural alphabetical sort by filename
     log.debug("Numeric ordering failed, trying alphabetical sort...")
     try:
-        sortedTracks = sorted(tracks, key=lambda t: Path(t.filename).name.lower())
-        log.debug(f"Alphabetical ordering succeeded: {[Path(t.filename).name for t in sortedTracks[:3]]}...")
-        return sortedTracks
+        names = [Path(t.filename).name for t in tracks]
+        sortKeys = [naturalSortKey(name) for name in names]
+        order = sorted(range(len(tracks)), key=sortKeys.__getitem__)
+        log.debug(f"Alphabetical ordering succeeded: {[names[i] for i in order[:3]]}...")
+        return [tracks[i] for i in order]
     except Exception as e:
         log.debug(f"Alphabetical ordering failed: {e}")
         return []
@@ -182,33 +260,13 @@ def detectDuplicateVersions(files, folderPath):
     patterns = {}
 
     for f in files:
-        name = f.stem
-        # Try to identify the pattern type by looking for common structures
         # Pattern 1: "XX - Title (N of M)" or "XX-Title-PartNN"
         # Pattern 2: "XX Title" or "Title XX"
+        # A " - " separator often indicates a different source
+        m = _PATTERN_UNION.match(f.stem)
+        pattern_key = m.lastgroup if m else "other"
 
-        # Check for "(N of M)" pattern
-        if re.search(r'\(\d+\s*of\s*\d+\)', name, re.IGNORECASE):
-            pattern_key = "n_of_m"
-        # Check for "-PartNN" pattern
-        elif re.search(r'-Part\d+', name, re.IGNORECASE):
-            pattern_key = "part_suffix"
-        # Check for "Part N" or "Part NN" pattern (space before Part)
-        elif re.search(r'\sPart\s*\d+', name, re.IGNORECASE):
-            pattern_key = "part_word"
-        # Check for " - " separator pattern (often indicates different source)
-        elif ' - ' in name and re.search(r'\d+\s*-\s*', name):
-            pattern_key = "dash_separator"
-        else:
-            # Default: group by whether it has leading numbers
-            if re.match(r'^\d+\s', name):
-                pattern_key = "numbered_prefix"
-            else:
-                pattern_key = "other"
-
-        if pattern_key not in patterns:
-            patterns[pattern_key] = []
-        patterns[pattern_key].append(f)
+        patterns.setdefault(pattern_key, []).append(f)
 
     # If only one pattern, no duplicates
     if len(patterns) <= 1:
@@ -223,7 +281,8 @@ def detectDuplicateVersions(files, folderPath):
     # 1. Check for single m4b file
     m4b_files = [f for f in files if f.suffix.lower() == '.m4b']
     if len(m4b_files) == 1:
-        skipped = [f for f in files if f not in m4b_files]
+        m4b_set = set(m4b_files)
+        skipped = [f for f in files if f not in m4b_set]
         log.info(f"Selected single m4b file: {m4b_files[0].name}")
         log.info(f"Skipped {len(skipped)} files (alternate version in same folder)")
         return m4b_files, {"selected": "single_m4b", "skipped_count": len(skipped), "folder": folderPath.name}
@@ -231,7 +290,8 @@ def detectDuplicateVersions(files, folderPath):
     # 2. Check for single m4a file
     m4a_files = [f for f in files if f.suffix.lower() == '.m4a']
     if len(m4a_files) == 1:
-        skipped = [f for f in files if f not in m4a_files]
+        m4a_set = set(m4a_files)
+        skipped = [f for f in files if f not in m4a_set]
         log.info(f"Selected single m4a file: {m4a_files[0].name}")
         log.info(f"Skipped {len(skipped)} files (alternate version in same folder)")
         return m4a_files, {"selected": "single_m4a", "skipped_count": len(skipped), "folder": folderPath.name}
@@ -239,7 +299,8 @@ def detectDuplicateVersions(files, folderPath):
     # 3. Select the pattern with the most files (more chapters = better)
     best_pattern = max(patterns.keys(), key=lambda k: len(patterns[k]))
     best_files = patterns[best_pattern]
-    skipped_files = [f for f in files if f not in best_files]
+    best_set = set(best_files)
+    skipped_files = [f for f in files if f not in best_set]
 
     log.info(f"Selected version with most chapters: {len(best_files)} files (pattern: {best_pattern})")
     log.info(f"Skipped {len(skipped_files)} files (alternate version in same folder)")
@@ -254,33 +315,52 @@ def detectDuplicateVersions(files, folderPath):
 
 
 # Global list to track duplicate version decisions for end-of-run summary
+# Guarded by a lock so books can be merged from worker threads
 duplicate_version_log = []
+_duplicateVersionLock = threading.Lock()
+
+def recordDuplicateVersion(versionInfo):
+    """Add a duplicate version decision to the end-of-run summary. Safe to call from any thread."""
+    with _duplicateVersionLock:
+        duplicate_version_log.append(versionInfo)
 
 def getDuplicateVersionLog():
-    """Return the log of duplicate version decisions for summary reporting."""
-    return duplicate_version_log
+    """Return a snapshot of the duplicate version decisions for summary reporting."""
+    with _duplicateVersionLock:
+        return list(duplicate_version_log)
 
 def clearDuplicateVersionLog():
     """Clear the duplicate version log (call at start of processing)."""
-    global duplicate_version_log
-    duplicate_version_log = []
+    with _duplicateVersionLock:
+        duplicate_version_log.clear()
 
 
-def orderByTitleAlphanumeric(tracks, folderPath=None):
+def orderByTitleAlphanumeric(tracks, folderPath=None, stems=None):
     """
     Order tracks by alphanumeric chapter keys like '01a', '01b', '02a'.
     Returns ordered list of tracks, or empty list if ordering fails.
+    stems: Optional precomputed filename stems, parallel to tracks.
     """
     log.debug("Attempting alphanumeric ordering...")
+    if stems is None:
+        stems = [Path(t.filename).stem for t in tracks]
     whichNum = 0
     maxAttempts = 5  # Prevent infinite loops
 
+    # findAlphanumericKey() inlined: extract every (number, letter) pair per stem once
+    upperStems = [stem.upper() for stem in stems]
+    stemKeys = [_ALPHANUM_RE.findall(up) for up in upperStems]
+
     while whichNum < maxAttempts:
         trackMap = {}
         allFound = True
 
-        for track in tracks:
-            key = findAlphanumericKey(Path(track.filename).stem, whichNum)
+        for track, up, matches in zip(tracks, upperStems, stemKeys):
+            if whichNum < len(matches):
+                numStr, letter = matches[whichNum]
+                key = (int(numStr), letter or '')
+            else:
+                key = _keywordAlphanumericKey(up)
             if key is None:
                 allFound = False
                 break
@@ -310,6 +390,36 @@ def orderByTitleAlphanumeric(tracks, folderPath=None):
     return []
     
 
+def _chapterPriority(name):
+    """Priority bucket for a chapter file name (lower wins), or None if it isn't audio we merge."""
+    ext = name.rsplit('.', 1)[-1].lower() if '.' in name else ''
+    if ext.startswith('mp'):    # mp3, mp2, mp4, mpga...
+        return 0
+    if ext.startswith('m4'):    # m4a, m4b, m4p...
+        return 1
+    if ext == 'flac':
+        return 2
+    if ext in ('wav', 'wave'):
+        return 3
+    return None
+
+def findChapterFiles(folderPath):
+    """
+    Return the chapter files in folderPath from the highest priority format present
+    (mp* > m4* > flac > wav), reading the directory once.
+    """
+    buckets = [[], [], [], []]
+    try:
+        with os.scandir(folderPath) as it:
+            for entry in it:
+                priority = _chapterPriority(entry.name)
+                if priority is not None and entry.is_file():
+                    buckets[priority].append(Path(entry.path))
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+    return next((bucket for bucket in buckets if bucket), [])
+
+
 def mergeBook(folderPath, outPath = False, move = False, finalOutputPath = None, outputAsM4B = False):
     """
     Merge chapter files into a single audiobook file.
@@ -332,18 +442,9 @@ def mergeBook(folderPath, outPath = False, move = False, finalOutputPath = None,
         skipBook(folderPath, f"Previously failed: {reason}")
         return None
 
-    files = list(folderPath.glob("*.mp*"))
+    files = findChapterFiles(folderPath)
     hasMultipleDisks = False
 
-    if len(files) < 1:
-        files = list(folderPath.glob("*.m4*"))
-
-    if len(files) < 1:
-        files = list(folderPath.glob("*.flac"))
-
-    if len(files) < 1:
-        files = list(folderPath.glob("*.wav"))
-
     if len(files) < 1:
         log.debug(f"No audio files found in {folderPath.name}")
         return None
@@ -351,7 +452,7 @@ def mergeBook(folderPath, outPath = False, move = False, finalOutputPath = None,
     # Detect and handle duplicate versions (e.g., 4-part vs 16-part versions)
     files, version_info = detectDuplicateVersions(files, folderPath)
     if version_info:
-        duplicate_version_log.append(version_info)
+        recordDuplicateVersion(version_info)
 
     # Determine output filepath
     # Always output to M4B for chapter merges - MP3 can't store chapter markers
@@ -381,25 +482,25 @@ def mergeBook(folderPath, outPath = False, move = False, finalOutputPath = None,
     log.debug(f"Attempting to capture metadata from: {sourceFile}")
     try:
         # Load metadata from the source file
-        sourceMetadata = mutagen.File(sourceFile, easy=True)
+        sourceMetadata = mutagen_fast.File(sourceFile, easy=True)
         if sourceMetadata:
             log.info(f"Successfully captured metadata from source file: {sourceFile.name}")
             # Extract metadata into a plain dictionary for persistence
             # Note: 'title' is excluded - in chapter files it's the chapter title, not book title
             # The book title comes from 'album'
-            for tag in ['artist', 'albumartist', 'album', 'date', 'genre']:
-                if tag in sourceMetadata:
-                    savedMetadata[tag] = sourceMetadata[tag]
-                    log.info(f"  {tag.capitalize()}: {sourceMetadata[tag]}")
+            savedMetadata = {tag: sourceMetadata[tag] for tag in _KEEP_TAGS if tag in sourceMetadata}
+            log.info(f"  Captured tags: {savedMetadata}")
 
             # Normalize artist/albumartist if they differ only in case
             # Use artist value (usually has better capitalization)
-            if 'artist' in savedMetadata and 'albumartist' in savedMetadata:
-                artist_val = savedMetadata['artist'][0] if savedMetadata['artist'] else ''
-                albumartist_val = savedMetadata['albumartist'][0] if savedMetadata['albumartist'] else ''
-                if artist_val.lower() == albumartist_val.lower() and artist_val != albumartist_val:
+            artist_list = savedMetadata.get('artist') or []
+            albumartist_list = savedMetadata.get('albumartist') or []
+            if artist_list and albumartist_list:
+                artist_val = artist_list[0]
+                albumartist_val = albumartist_list[0]
+                if artist_val != albumartist_val and artist_val.casefold() == albumartist_val.casefold():
                     log.info(f"  Normalizing albumartist capitalization: '{albumartist_val}' -> '{artist_val}'")
-                    savedMetadata['albumartist'] = savedMetadata['artist']
+                    savedMetadata['albumartist'] = artist_list
         else:
             log.debug(f"Source file has no metadata tags: {sourceFile.name}")
     except Exception as e:
@@ -439,7 +540,7 @@ def mergeBook(folderPath, outPath = False, move = False, finalOutputPath = None,
             # Clean author and title for path
             cleanAuthor = cleanAuthorForPath(author)
             cleanTitle = cleanTitleForPath(title)
-            expectedOutputPath = Path(settings.output) / cleanAuthor / cleanTitle
+            expectedOutputPath = bookOutputPath(cleanAuthor, cleanTitle)
 
             # If -CV mode, only .m4b counts as existing output
             existingFile = checkOutputExists(expectedOutputPath, title, requireM4B=settings.convert)
@@ -447,57 +548,31 @@ def mergeBook(folderPath, outPath = False, move = False, finalOutputPath = None,
                 skipBook(folderPath, f"Output already exists: {existingFile.name}")
                 return
 
-    # Determine where to put temp copies during merge
-    if finalOutputPath:
-        # Direct output mode - put temp copies in output folder's parent
-        tempCopyDir = Path(finalOutputPath).parent
-    elif outPath:
-        tempCopyDir = outPath
-    else:
-        tempCopyDir = folderPath
-
-    for i in range(len(files)):
-        # Handle file preparation based on operation mode
-        if move:
-            # Moving: sanitize files in place
-            files[i] = sanitizeFile(files[i])
-        elif finalOutputPath:
-            # Direct output mode: copy chapter files to output folder temporarily
-            path, name = os.path.split(files[i])
-            tempCopy = shutil.copy(files[i], os.path.join(tempCopyDir, name))
-            files[i] = sanitizeFile(tempCopy)
-        elif outPath:
-            # Copying to temp folder: copy first, then sanitize the copy
-            path, name = os.path.split(files[i])
-            tempCopy = shutil.copy(files[i], os.path.join(outPath, name))
-            files[i] = sanitizeFile(tempCopy)
-        else:
-            # Copying in same folder: create COPY prefix versions
-            path, name = os.path.split(files[i])
-            copyFile = shutil.copy(files[i], os.path.join(path, f"COPY{name}"))
-            files[i] = sanitizeFile(copyFile)
+    # Moving: sanitize files in place since the user opted into mutating the source
+    # Copying: use the source files directly - the concat list escapes apostrophes for ffmpeg,
+    # so there's no need to stage sanitized copies
+    if move:
+        files = [sanitizeFile(f) for f in files]
 
     pieces = orderFiles(files, folderPath)
 
     if len(pieces) == 0:
-        # Clean up copied files when ordering fails
-        if outPath or finalOutputPath:
-            log.debug("Cleaning up temp files after ordering failure")
-            for f in files:
-                try:
-                    Path(f).unlink()
-                except Exception as e:
-                    log.debug(f"Failed to clean up temp file: {e}")
         return
 
     # TODO When sanitizing chapter files, worth trying to keep the original name in chapter metadata?
-    # Create temp files in the directory where the audio files actually are
-    tempDir = tempCopyDir
-    tempConcatFilePath, tempChapFilePath = createTempFiles(pieces, tempDir)
+    # Put the temp concat/chapter lists next to the merged output:
+    # the final output folder in direct mode, else the temp folder, else the book folder
+    tempListDir = newFilepath.parent
+    tempConcatFilePath, tempChapFilePath = createTempFiles(pieces, tempListDir)
+    mergedPaths = [piece.filename for piece in pieces if piece is not None]
 
     # Detect if input files need transcoding to AAC for M4B output
-    # MP3, FLAC, WAV all need transcoding - only M4A/M4B can be stream-copied
+    # MP3, FLAC, WAV all need transcoding - only M4A/M4B can be stream-copied,
+    # and only when every chapter shares one format
     needsTranscode = inputExt in ['.mp3', '.flac', '.wav', '.wave']
+    if not needsTranscode and not _canStreamCopy([piece for piece in pieces if piece is not None]):
+        log.info("Chapter files differ in format - transcoding instead of stream copying")
+        needsTranscode = True
 
     # Build FFmpeg command
     if needsTranscode:
@@ -562,19 +637,17 @@ def mergeBook(folderPath, outPath = False, move = False, finalOutputPath = None,
                 if coverPath.exists():
                     try:
                         log.debug(f"Found cover image: {coverPath}")
-                        with open(coverPath, 'rb') as f:
-                            coverData = f.read()
 
                         # Check file type and use appropriate method
-                        if str(newFilepath).lower().endswith(('.m4a', '.m4b', '.mp4')):
-                            from mutagen.mp4 import MP4, MP4Cover
+                        # The image is only read once we know it can be embedded - both mutagen
+                        # cover types serialize from bytes, so it's read in a single call
+                        mergedExt = newFilepath.suffix.lower()
+                        if mergedExt in _MP4_EXTS:
                             mp4File = MP4(newFilepath)
-                            mp4File['covr'] = [MP4Cover(coverData, imageformat=MP4Cover.FORMAT_JPEG)]
+                            mp4File['covr'] = [MP4Cover(coverPath.read_bytes(), imageformat=MP4Cover.FORMAT_JPEG)]
                             mp4File.save()
                             log.info("Cover image embedded successfully")
-                        elif str(newFilepath).lower().endswith('.mp3'):
-                            from mutagen.mp3 import MP3
-                            from mutagen.id3 import ID3, APIC
+                        elif mergedExt == '.mp3':
                             mp3File = MP3(newFilepath)
                             if mp3File.tags is None:
                                 mp3File.add_tags()
@@ -583,7 +656,7 @@ def mergeBook(folderPath, outPath = False, move = False, finalOutputPath = None,
                                 mime='image/jpeg',
                                 type=3,  # Cover (front)
                                 desc='Cover',
-                                data=coverData
+                                data=coverPath.read_bytes()
                             ))
                             mp3File.save()
                             log.info("Cover image embedded successfully")
@@ -618,21 +691,15 @@ def mergeBook(folderPath, outPath = False, move = False, finalOutputPath = None,
 
         # Clean up chapter files after successful merge
         # When moving, delete source files
-        # When copying to outPath (temp folder), delete the temp copies
-        # For finalOutputPath mode, delete the temp copies in output folder
-        if move or outPath or finalOutputPath:
-            if os.path.exists(tempConcatFilePath):
-                with open(tempConcatFilePath, 'r') as t:
-                    for line in t:
-                        # Unescape apostrophes that were escaped for ffmpeg
-                        filepath = line[5:].strip().strip('\'').replace("'\\''", "'")
-                        try:
-                            os.remove(filepath)
-                            log.debug(f"Deleted chapter file: {Path(filepath).name}")
-                        except Exception as e:
-                            log.warning(f"Failed to delete chapter file {filepath}: {e}")
-            else:
-                log.warning(f"Temp concat file not found for cleanup: {tempConcatFilePath}")
+        # When copying, the source files were used directly and are left alone
+        if move:
+            # The ordered pieces are exactly the files written to the concat list
+            for filepath in mergedPaths:
+                try:
+                    os.remove(filepath)
+                    log.debug(f"Deleted chapter file: {Path(filepath).name}")
+                except Exception as e:
+                    log.warning(f"Failed to delete chapter file {filepath}: {e}")
 
         # Clean up temp concat/chapter files
         try:
@@ -645,16 +712,6 @@ def mergeBook(folderPath, outPath = False, move = False, finalOutputPath = None,
         failBook(folderPath, "ffmpeg error during chapter merge")
         # Clean up temp files even on failure
         try:
-            # Clean up audio chapter files that were copied to temp
-            if outPath or finalOutputPath:
-                with open(tempConcatFilePath, 'r') as t:
-                    for line in t:
-                        try:
-                            # Unescape apostrophes that were escaped for ffmpeg
-                            filepath = line[5:].strip().strip('\'').replace("'\\''", "'")
-                            os.remove(filepath)
-                        except:
-                            pass
             os.remove(tempConcatFilePath)
             os.remove(tempChapFilePath)
             # Also clean up partial output file if it exists
@@ -669,20 +726,46 @@ def mergeBook(folderPath, outPath = False, move = False, finalOutputPath = None,
 
     return newFilepath
 
+def _formatSignature(track):
+    """(codec, sample rate, channels) of a chapter track, None for anything the reader doesn't expose."""
+    info = getattr(track, 'info', None)
+    return (getattr(info, 'codec', None), getattr(info, 'sample_rate', None), getattr(info, 'channels', None))
+
+def _canStreamCopy(tracks):
+    """
+    True if the ordered chapter tracks can be concatenated with -codec copy: all MP4 audio in one
+    codec, sample rate and channel layout. Stream copy doesn't resample, so a mixed set would
+    produce a broken M4B.
+    """
+    if any(Path(track.filename).suffix.lower() not in _MP4_EXTS for track in tracks):
+        return False
+    return len({_formatSignature(track) for track in tracks}) <= 1
+
+def _readChapterTrack(file):
+    """Read chapter metadata for orderFiles. Returns (track, exception) so errors are handled by the caller."""
+    try:
+        return mutagen_fast.File(file, easy=True), None
+    except Exception as e:
+        return None, e
+
+
 def orderFiles(files, folderPath=None):
     pieces = []
     tracks = []
     hasMultipleDisks = False
 
-    for file in files:
-        try:
-            track = mutagen.File(file, easy=True)
-        except mutagen.mp3.HeaderNotFoundError:
+    # Metadata reads are I/O-bound and independent - read them in parallel
+    # map() preserves input order, so results line up with files
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(files)))) as executor:
+        results = list(executor.map(_readChapterTrack, files))
+
+    for file, (track, error) in zip(files, results):
+        if isinstance(error, mutagen.mp3.HeaderNotFoundError):
             failBook(folderPath, "Corrupt or unreadable audio file")
             return []
-        except Exception as e:
-            log.error(f"Error reading file {file}: {e}")
-            failBook(folderPath, f"Error reading chapter file: {e}")
+        elif error is not None:
+            log.error(f"Error reading file {file}: {error}")
+            failBook(folderPath, f"Error reading chapter file: {error}")
             return []
 
         if track is None:
@@ -717,55 +800,97 @@ def orderFiles(files, folderPath=None):
 
     return pieces
 
+def _escapeConcatPath(path):
+    """
+    Escape apostrophes for an ffmpeg concat entry: ' -> '\\'' (end quote, escaped apostrophe, start quote).
+    Most paths have none, so skip the replace pass for those.
+    """
+    if "'" not in path:
+        return path
+    return path.replace("'", "'\\''")
+
+
 def createTempFiles(pieces, folderPath):
     log.debug("Write files to tempConcatFileList")
-    tempConcatFilepath = ""
-    tempChapFilepath = ""
+    # Build both lists in memory buffers and write each in one call - they're bounded by the chapter count
+    #TODO skip books when this errors instead of crashing whole script? Especially on the for p loop. //This should be solved by checking for empty pieces list. Keep an eye on it.
+    concatBuffer = io.StringIO()
+    chapBuffer = io.StringIO()
+    chapBuffer.write(";FFMETADATA1\n")
+    runningTime = 0
+    chapCount = 1
+    addConcat = concatBuffer.write
+    addChapter = chapBuffer.write
+
+    for p in pieces: #p = mutagen easyMP*
+        # Safety check - skip None entries
+        if p is None:
+            log.error("Encountered None track in pieces list - this shouldn't happen")
+            continue
+        # Paths are absolute since ffmpeg resolves relative entries against the list's folder,
+        # and the source files may live outside it
+        escapedFilename = _escapeConcatPath(os.path.abspath(p.filename))
+        addConcat(f"file '{escapedFilename}'\n")
+
+        # Touch the mutagen info chain once per piece
+        lengthMs = p.info.length * 1000
+        start = runningTime
+        runningTime += lengthMs
+        addChapter(f"[CHAPTER]\nTIMEBASE=1/1000\nSTART={start}\nEND={runningTime}\ntitle=Chapter {chapCount}\n\n")
+        chapCount += 1
+
     with tempfile.NamedTemporaryFile(delete=False, mode='w', suffix='.txt', dir=folderPath) as tempConcatFile, \
     tempfile.NamedTemporaryFile(delete=False, mode='w', suffix='.txt', dir=folderPath) as tempChapFile:
-        #TODO skip books when this errors instead of crashing whole script? Especially on the for p loop. //This should be solved by checking for empty pieces list. Keep an eye on it.
-        runningTime = 0
-        chapCount = 1
-        tempChapFile.write(";FFMETADATA1\n")
-
-        for p in pieces: #p = mutagen easyMP*
-            # Safety check - skip None entries
-            if p is None:
-                log.error("Encountered None track in pieces list - this shouldn't happen")
-                continue
-            # Escape apostrophes in filename for ffmpeg concat format
-            # Replace ' with '\'' (end quote, escaped apostrophe, start quote)
-            escapedFilename = p.filename.replace("'", "'\\''")
-            tempConcatFile.write(f"file '{escapedFilename}'\n")
+        tempConcatFile.write(concatBuffer.getvalue())
+        tempChapFile.write(chapBuffer.getvalue())
 
-            tempChapFile.write("[CHAPTER]\n")
-            tempChapFile.write("TIMEBASE=1/1000\n")
-            tempChapFile.write(f"START={runningTime}\n")
-            runningTime += p.info.length * 1000
-            tempChapFile.write(f"END={runningTime}\n")
-            tempChapFile.write(f"title=Chapter {chapCount}\n\n")
-            chapCount += 1
+    return tempConcatFile.name, tempChapFile.name
 
-        tempConcatFilepath = tempConcatFile.name
-        tempChapFilepath = tempChapFile.name
 
+def _scanEntries(folderPath):
+    """All os.DirEntry objects in folderPath from a single directory read, in directory order."""
+    try:
+        with os.scandir(folderPath) as it:
+            return list(it)
+    except OSError as e:
+        log.warning(f"Cannot scan folder {folderPath}: {e}")
+        return []
 
 
-    return tempConcatFilepath, tempChapFilepath
+def _scanFolder(folder, entries=None, batchFull=None):
+    """
+    One traversal step for findBooks: (folder Path, subfolders, audio files or -1).
+    Subfolders and audio files both come from the same directory read. Subfolders are
+    os.DirEntry objects - only .name and .path are needed until a folder is actually visited.
+    folder: path string or os.PathLike. entries: the folder's _scanEntries result, if already read.
+    batchFull: threading.Event; once set the result won't be used, so the read is skipped (returns None).
+    """
+    if batchFull is not None and batchFull.is_set():
+        return None
+    folderPath = Path(folder)
+    if entries is None:
+        entries = _scanEntries(folderPath)
+    # Symlinked folders aren't descended into: a link back up the tree (Author/link -> ..) would loop forever
+    return folderPath, [entry for entry in entries if entry.is_dir(follow_symlinks=False)], getAudioFilesFromEntries(entries)
+
 
+def _cachedAudioFiles(entryCache, entry):
+    """getAudioFiles for a subfolder entry, reading each folder at most once per entryCache."""
+    entries = entryCache.get(entry.path)
+    if entries is None:
+        entries = entryCache[entry.path] = _scanEntries(entry.path)
+    return getAudioFilesFromEntries(entries)
 
-def findBooks(startPath, batchLimit, root=None, books=None, offset=0, scanState=None):
+
+def findBooks(startPath, batchLimit, offset=0):
     """
-    Recursively scan directories and return a list of books to process.
+    Scan directories depth-first and return a list of books to process.
     Does NOT copy or move any files - just identifies what needs processing.
 
     Args:
         startPath: Directory to scan
         batchLimit: Maximum number of books to return
-        root: Root directory (used internally for recursion)
-        books: Accumulated list of books (used internally for recursion)
         offset: Number of books to skip before collecting (for batch continuation)
-        scanState: Dict for tracking scan progress (used internally)
 
     Returns a list of dicts, each containing:
     - type: "single" or "chapters"
@@ -773,216 +898,216 @@ def findBooks(startPath, batchLimit, root=None, books=None, offset=0, scanState=
     - source_file: For single files, the file path
     - files: For chapter books, list of files (not used for single)
     """
-    if root is None:
-        root = startPath
-    if books is None:
-        books = []
-    if scanState is None:
-        # Initialize scan state at root level
-        scanState = {'folders_scanned': 0, 'last_log': 0}
-        log.info(f"Scanning for audiobooks in {startPath}...")
+    log.info(f"Scanning for audiobooks in {startPath}...")
+    books = []
+    scanState = {'folders_scanned': 0, 'last_log': 0}
 
     # We need to collect offset + batchLimit books to return the right slice
-    # Stop if we've reached the total needed
+    # batchFull is set as soon as that many are found - the walk and the read-ahead workers both watch it
     totalNeeded = offset + batchLimit
-    if len(books) >= totalNeeded:
-        return books
+    batchFull = threading.Event()
+    if totalNeeded <= 0:
+        batchFull.set()
 
-    subfolders = [path for path in startPath.glob('*') if path.is_dir()]
+    def addBook(book):
+        books.append(book)
+        if len(books) >= totalNeeded:
+            batchFull.set()
 
-    # Smart multi-disc detection: Look for folders with similar names and incrementing numbers
-    # This handles: "CD 1", "Disc 2", "Book [Disc 1]", "Book - Part 2", "1", "2", etc.
-    def extractBaseAndNumber(folderName):
-        """Extract base name and number from folder name. Returns (baseName, number) or (None, None)."""
-        name = folderName.strip()
-
-        # Pattern 1: Just a number like "1", "2", "3"
-        if re.match(r'^\d+$', name):
-            return ('', int(name))
-
-        # Pattern 2: Ends with a number, possibly with separators/brackets
-        # Matches: "CD 1", "Disc-2", "Book [Disc 3]", "Part 4", "Book Name - 5", etc.
-        match = re.match(r'^(.+?)[\s_-]*[\[\(]?(?:cd|disc|disk|part|volume|vol)?[\s_-]*(\d+)[\]\)]?\s*$', name, re.IGNORECASE)
-        if match:
-            base = match.group(1).strip()
-            # Clean trailing separators from base
-            base = re.sub(r'[\s_,-]+$', '', base)
-            return (base, int(match.group(2)))
-
-        return (None, None)
-
-    def normalizeBaseName(name):
-        """Normalize base name for comparison (lowercase, remove punctuation)."""
-        if not name:
-            return ''
-        return re.sub(r'[^\w\s]', '', name.lower()).strip()
-
-    # Extract base name and number for each subfolder
-    folderInfo = []  # [(folder, baseName, number), ...]
-    unmatchedFolders = []
+    # Directory reads are I/O bound, so folders are scanned ahead on a thread pool as soon as
+    # they're queued. Results are still consumed in stack order, keeping batches deterministic
+    workers = settings.workers * 4 if settings and settings.workers > 1 else 1
+    executor = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+    pending = {}  # folder path string -> Future of _scanFolder(folder)
 
-    for folder in subfolders:
-        base, num = extractBaseAndNumber(folder.name)
-        if num is not None:
-            folderInfo.append((folder, base, num))
-        else:
-            unmatchedFolders.append(folder)
-
-    # Group folders by similar base name
-    baseGroups = {}  # normalizedBase -> [(folder, originalBase, number), ...]
-    for folder, base, num in folderInfo:
-        normBase = normalizeBaseName(base)
-        if normBase not in baseGroups:
-            baseGroups[normBase] = []
-        baseGroups[normBase].append((folder, base, num))
-
-    # Process groups with 2+ folders as multi-disc books
-    processedFolders = set()
-    for normBase, group in baseGroups.items():
-        if len(group) >= 2:
-            # Sort by number
-            group.sort(key=lambda x: x[2])
-
-            # Verify numbers are reasonable (incrementing, not huge gaps)
-            numbers = [x[2] for x in group]
-            if max(numbers) - min(numbers) < len(numbers) * 2:  # Allow some gaps but not crazy ones
-                # Collect all audio files
-                allFiles = []
-                for folder, base, num in group:
-                    files = getAudioFiles(folder)
-                    if files != -1 and len(files) > 0:
-                        for f in files:
-                            allFiles.append((num, f))
-                    processedFolders.add(folder)
-
-                if allFiles:
-                    # Sort by number, then filename
-                    allFiles.sort(key=lambda x: (x[0], x[1].name))
-                    fileList = [f for _, f in allFiles]
-
-                    # Determine book name: use the original base name from first folder, or parent folder name
-                    originalBase = group[0][1]
-                    bookName = originalBase if originalBase else startPath.name
-                    sourceFolder = group[0][0].parent
-
-                    log.debug(f"Found multi-part book: {bookName} ({len(group)} parts, {len(fileList)} total files)")
-                    books.append({
+    def queueScans(folders, entryCache=None):
+        # Once the batch is full nothing queued would be visited, so don't start scanning it
+        if batchFull.is_set():
+            return
+        for f in reversed(folders):
+            key = os.fspath(f)
+            # Reuse the directory read if the multi-disc/CD checks already listed this folder
+            known = entryCache.get(key) if entryCache else None
+            if executor:
+                pending[key] = executor.submit(_scanFolder, key, known, batchFull)
+            stack.append((key, False, False, known))
+
+    def takeScan(key, known):
+        future = pending.pop(key, None)
+        return future.result() if future else _scanFolder(key, known)
+
+    # Work stack of (folder, collectFiles, hasSubfolders, files). Each folder is pushed once to
+    # scan its subfolders and once more, beneath them, to collect its own audio files - so a
+    # folder's files are found after everything nested inside it, in directory order.
+    # Scan entries hold the folder as a path string plus any already-read directory entries in
+    # files; it only becomes a Path once visited. Collect entries hold the Path and its audio files
+    stack = []
+    queueScans([startPath])
+    try:
+        while stack and not batchFull.is_set():
+            folder, collectFiles, hasSubfolders, files = stack.pop()
+
+            if collectFiles:
+                # Check if we should process files in this folder
+                # Skip if no files, but allow processing root folder if it has no subfolders with audio
+                shouldSkipRoot = folder == startPath and hasSubfolders
+                if files == -1 or shouldSkipRoot:
+                    pass
+                elif len(files) == 1:
+                    # Single-file book - add to list
+                    addBook({
+                        'type': 'single',
+                        'source_path': folder,
+                        'source_file': files[0]
+                    })
+                    log.debug(f"Found single-file book: {files[0].name}")
+                elif len(files) > 1:
+                    # Multi-file chapter book - add to list
+                    addBook({
                         'type': 'chapters',
-                        'source_path': sourceFolder,
-                        'source_name': bookName,
-                        'files': fileList,
-                        'multi_cd': True
+                        'source_path': folder,
+                        'files': files
                     })
+                    log.debug(f"Found chapter book: {folder.name} ({len(files)} files)")
+                continue
+
+            folder, subfolders, ownFiles = takeScan(folder, files)
 
-                    scanState['folders_scanned'] += len(group)
-
-                    if len(books) >= totalNeeded:
-                        if startPath == root:
-                            log.info(f"Scan complete: found {len(books)} books in {scanState['folders_scanned']} folders/subfolders")
-                            if offset > 0:
-                                return books[offset:]
-                        return books
-
-    # Folders that weren't part of a multi-disc group go back to normal processing
-    remainingFolders = [f for f in subfolders if f not in processedFolders]
-    subfolders = remainingFolders
-
-    # Legacy check for pure CD/Disc subfolders (now mostly handled above, but keep as fallback)
-    cdFolderPattern = re.compile(r'^(cd|disc|disk)\s*[-_]?\s*(\d+)$', re.IGNORECASE)
-    cdFolders = [f for f in subfolders if cdFolderPattern.match(f.name)]
-    nonCdFolders = [f for f in subfolders if not cdFolderPattern.match(f.name)]
-
-    # If we have CD folders and they're the majority, treat this as a multi-CD book
-    if cdFolders and len(cdFolders) >= len(nonCdFolders):
-        # Sort CD folders by disc number
-        def getCdNumber(folder):
-            match = cdFolderPattern.match(folder.name)
-            return int(match.group(2)) if match else 0
-        cdFolders.sort(key=getCdNumber)
-
-        # Collect all audio files from all CD folders
-        allCdFiles = []
-        for cdFolder in cdFolders:
-            cdFiles = getAudioFiles(cdFolder)
-            if cdFiles != -1 and len(cdFiles) > 0:
-                discNum = getCdNumber(cdFolder)
-                for f in cdFiles:
-                    allCdFiles.append((discNum, f))
-
-        if allCdFiles:
-            # Sort by disc number, then by filename
-            allCdFiles.sort(key=lambda x: (x[0], x[1].name))
-            files = [f for _, f in allCdFiles]
-
-            log.debug(f"Found multi-CD book: {startPath.name} ({len(cdFolders)} discs, {len(files)} total files)")
-            books.append({
-                'type': 'chapters',
-                'source_path': startPath,
-                'files': files,
-                'multi_cd': True
-            })
-
-            scanState['folders_scanned'] += len(cdFolders)
-
-            for folder in nonCdFolders:
-                if len(books) >= totalNeeded:
-                    return books
+            # Update scan progress
+            if folder != startPath:
                 scanState['folders_scanned'] += 1
                 if scanState['folders_scanned'] - scanState['last_log'] >= 100:
                     log.info(f"  Scanned {scanState['folders_scanned']} folders/subfolders, found {len(books)} books so far...")
                     scanState['last_log'] = scanState['folders_scanned']
-                books = findBooks(folder, batchLimit, root, books, offset, scanState)
 
-            if startPath == root:
-                log.info(f"Scan complete: found {len(books)} books in {scanState['folders_scanned']} folders/subfolders")
-                if offset > 0:
-                    return books[offset:]
-            return books
+            entryCache = {}  # subfolder path string -> _scanEntries result, shared by the checks below and the scan
 
-    # Normal processing for non-CD folders
-    for folder in subfolders:
-        if len(books) >= totalNeeded:
-            return books
+            # Smart multi-disc detection: Look for folders with similar names and incrementing numbers
+            # This handles: "CD 1", "Disc 2", "Book [Disc 1]", "Book - Part 2", "1", "2", etc.
+            # Extract base name and number for each subfolder and group by normalized base in one pass
+            baseGroups = defaultdict(list)  # normalizedBase -> [(folder, originalBase, number), ...]
+            for subfolder in subfolders:
+                name = subfolder.name.strip()
 
-        # Update scan progress
-        scanState['folders_scanned'] += 1
-        if scanState['folders_scanned'] - scanState['last_log'] >= 100:
-            log.info(f"  Scanned {scanState['folders_scanned']} folders/subfolders, found {len(books)} books so far...")
-            scanState['last_log'] = scanState['folders_scanned']
+                # Pattern 1: Just a number like "1", "2", "3"
+                if _NUM_ONLY_RE.match(name):
+                    base, num = '', int(name)
+                else:
+                    # Pattern 2: Ends with a number, possibly with separators/brackets
+                    # Matches: "CD 1", "Disc-2", "Book [Disc 3]", "Part 4", "Book Name - 5", etc.
+                    match = _BASE_NUM_RE.match(name)
+                    if not match:
+                        continue
+                    # Clean trailing separators from base
+                    base = _TRAIL_SEP_RE.sub('', match.group(1).strip())
+                    num = int(match.group(2))
+
+                # Normalize base name for comparison (lowercase, remove punctuation)
+                normBase = _NON_WORD_RE.sub('', base.lower()).strip() if base else ''
+                baseGroups[normBase].append((subfolder, base, num))
+
+            # Process groups with 2+ folders as multi-disc books
+            processedFolders = set()  # folder names - unique among siblings
+            for normBase, group in baseGroups.items():
+                if batchFull.is_set():
+                    break
+                if len(group) >= 2:
+                    # Sort by number
+                    group.sort(key=lambda x: x[2])
+
+                    # Verify numbers are reasonable (incrementing, not huge gaps)
+                    # Group is sorted by number, so its ends are the extremes
+                    if group[-1][2] - group[0][2] < len(group) * 2:  # Allow some gaps but not crazy ones
+                        # Collect all audio files
+                        allFiles = []
+                        for subfolder, base, num in group:
+                            files = _cachedAudioFiles(entryCache, subfolder)
+                            if files != -1 and len(files) > 0:
+                                for f in files:
+                                    allFiles.append((num, f))
+                            processedFolders.add(subfolder.name)
+
+                        if allFiles:
+                            # Sort by number, then filename
+                            allFiles.sort(key=lambda x: (x[0], x[1].name))
+                            fileList = [f for _, f in allFiles]
+
+                            # Determine book name: use the original base name from first folder, or parent folder name
+                            originalBase = group[0][1]
+                            bookName = originalBase if originalBase else folder.name
+                            sourceFolder = folder   # the parent of every folder in the group
+
+                            log.debug(f"Found multi-part book: {bookName} ({len(group)} parts, {len(fileList)} total files)")
+                            addBook({
+                                'type': 'chapters',
+                                'source_path': sourceFolder,
+                                'source_name': bookName,
+                                'files': fileList,
+                                'multi_cd': True
+                            })
+
+                            scanState['folders_scanned'] += len(group)
+
+            if batchFull.is_set():
+                break
 
-        books = findBooks(folder, batchLimit, root, books, offset, scanState)
+            # Folders that weren't part of a multi-disc group go back to normal processing
+            remainingFolders = [f for f in subfolders if f.name not in processedFolders]
+            subfolders = remainingFolders
+
+            # Legacy check for pure CD/Disc subfolders (now mostly handled above, but keep as fallback)
+            # One match per folder; CD folders keep their disc number for sorting below
+            cdFolders = []  # [(discNumber, folder), ...]
+            nonCdFolders = []
+            for f in subfolders:
+                match = _CD_FOLDER_RE.match(f.name)
+                if match:
+                    cdFolders.append((int(match.group(2)), f))
+                else:
+                    nonCdFolders.append(f)
+
+            # If we have CD folders and they're the majority, treat this as a multi-CD book
+            if cdFolders and len(cdFolders) >= len(nonCdFolders):
+                # Sort CD folders by disc number
+                cdFolders.sort(key=lambda x: x[0])
+
+                # Collect all audio files from all CD folders
+                allCdFiles = []
+                for discNum, cdFolder in cdFolders:
+                    cdFiles = _cachedAudioFiles(entryCache, cdFolder)
+                    if cdFiles != -1 and len(cdFiles) > 0:
+                        for f in cdFiles:
+                            allCdFiles.append((discNum, f))
+
+                if allCdFiles:
+                    # Sort by disc number, then by filename
+                    allCdFiles.sort(key=lambda x: (x[0], x[1].name))
+                    files = [f for _, f in allCdFiles]
+
+                    log.debug(f"Found multi-CD book: {folder.name} ({len(cdFolders)} discs, {len(files)} total files)")
+                    addBook({
+                        'type': 'chapters',
+                        'source_path': folder,
+                        'files': files,
+                        'multi_cd': True
+                    })
 
-    # Get audio files in this folder
-    files = getAudioFiles(startPath)
+                    scanState['folders_scanned'] += len(cdFolders)
 
-    # Check if we should process files in this folder
-    # Skip if no files, but allow processing root folder if it has no subfolders with audio
-    shouldSkipRoot = startPath == root and len(subfolders) > 0
-    if files == -1 or shouldSkipRoot:
-        pass
-    elif len(files) == 1:
-        # Single-file book - add to list
-        books.append({
-            'type': 'single',
-            'source_path': startPath,
-            'source_file': files[0]
-        })
-        log.debug(f"Found single-file book: {files[0].name}")
-    elif len(files) > 1:
-        # Multi-file chapter book - add to list
-        books.append({
-            'type': 'chapters',
-            'source_path': startPath,
-            'files': files
-        })
-        log.debug(f"Found chapter book: {startPath.name} ({len(files)} files)")
-
-    # At the root level, log completion and apply offset slicing before returning
-    if startPath == root:
-        log.info(f"Scan complete: found {len(books)} books in {scanState['folders_scanned']} folders/subfolders")
-        if offset > 0:
-            return books[offset:]
-    return books
+                    # The CD folders are the book itself - only the other subfolders are scanned
+                    queueScans(nonCdFolders, entryCache)
+                    continue
+
+            # Normal processing: subfolders first, then this folder's own files
+            stack.append((folder, True, len(subfolders) > 0, ownFiles))
+            queueScans(subfolders, entryCache)
+    finally:
+        if executor:
+            # Stop scanning ahead once the batch is full
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    log.info(f"Scan complete: found {len(books)} books in {scanState['folders_scanned']} folders/subfolders")
+    return books[offset:totalNeeded]
 
 
 # Keep old function for backwards compatibility, but mark as deprecated
@@ -1008,9 +1133,11 @@ def combineAndFindChapters(startPath, outPath, counter, root):
         originalFile = files[0]
         newFile = outPath / f"{files[0].name}"
         if settings.move:
-            files[0].rename(newFile)
+            os.replace(files[0], newFile)
         else:
-            shutil.copy(files[0], newFile)
+            # copyfile uses the kernel's zero-copy path (sendfile/copy_file_range) where available;
+            # the permission bits shutil.copy would also carry over don't matter for audio files
+            shutil.copyfile(files[0], newFile)
         setOriginalPath(newFile, originalFile)
     elif len(files) > 1:
         counter += 1
@@ -1,9 +1,5 @@
 import argparse
 import Settings
-import Util
-import Processing
-import FileMerger
-import BookStatus
 import logging as log
 from pathlib import Path
 import sys
@@ -21,6 +17,13 @@ settings = None
 def main(args):
     #Yes, I know this approach isn't super elegant. Feel free to recommend an alternative that isn't more of a pain in the ass like a config file.
     global settings
+    # Feature modules pull in mutagen, requests, selenium etc. - import them only once arguments
+    # have parsed, so --help and argument errors exit without paying for them
+    import Util
+    import Processing
+    import FileMerger
+    import BookStatus
+
     settings = Settings.Settings(args)
     Settings.setSettings(settings)
     Util.loadSettings()
@@ -45,6 +48,8 @@ def main(args):
 
 def processBooks():
     global settings
+    import Processing
+    import BookStatus
 
     if (settings.recurseFetch and settings.recurseCombine) or (settings.recurseFetch and settings.recursePreserve) or (settings.recurseCombine and settings.recursePreserve):
         log.critical("Incompatible processing modes selected. Enable only one processing mode. Exiting...")
@@ -70,6 +75,7 @@ if __name__ == "__main__":
     # Parse arguments first to get log level
     parser = argparse.ArgumentParser(prog = "Ultimate Audiobooks")
     parser.add_argument("-B", "--batch", type=int, default = 10) #batch size
+    parser.add_argument("-AC", "--autoContinue", action = "store_true") #run the next batch without asking until the input is exhausted
     parser.add_argument("-CL", "--clean", action = "store_true") #overwrite audio file metadata
     parser.add_argument("-CV", "--convert", action = "store_true") #convert to .m4b
     parser.add_argument("-CR", "--create", default = None, type=str.upper, choices = ["INFOTEXT", "OPF"]) #create metadata file where nonexistant. Where existant, skip unless --force is enabled
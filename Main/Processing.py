@@ -4,19 +4,42 @@ from Settings import getSettings
 from pathlib import Path
 from Util import *
 from FileMerger import combineAndFindChapters, findBooks, mergeBook, getDuplicateVersionLog, clearDuplicateVersionLog
-from BookStatus import skipBook, failBook, checkOutputExists, isMergedFromChapters, _isInTempFolder, _deleteTempFile
+from BookStatus import skipBook, failBook, checkOutputExists, listOutputFolder, isMergedFromChapters, getOriginalPath, _isInTempFolder, _deleteTempFile, clearFailMarkerCache
 import os
 from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait, as_completed
 import math
 import re
-import shutil
 import subprocess
+import threading
+import json
+import tempfile
+from collections import defaultdict, deque
+from itertools import islice
+
+# tinytag - optional, header-only tag reader used for the duplicate-detection author/title probe
+# Falls back to mutagen when missing or when it can't answer
+try:
+    from tinytag import TinyTag
+    TINYTAG_AVAILABLE = True
+except ImportError:
+    TINYTAG_AVAILABLE = False
 
 
 
 log = logging.getLogger(__name__)
 settings = None
 conversions = []
+# Output bookPath -> source file name for every queued conversion, so isConversionQueued is a lookup
+_queuedByBookPath = {}
+_conversionsLock = threading.Lock()
+
+# Chapter-book pool shared by every batch of a recursive combine run (see _getCombineExecutor)
+_combineExecutor = None
+
+# Filenames that look like numbered chapters (01_, 02 -, Track 1, Chapter 3, Part 2...)
+_CHAPTER_RE = re.compile(r'^(\d+[-_\s]|track\s*\d+|chapter\s*\d+|part\s*\d+)', re.IGNORECASE)
+# Word boundaries for comparing filenames: dashes, underscores and whitespace
+_WORD_SPLIT_RE = re.compile(r'[-_\s]+')
 
 # List of books/files deferred for interactive metadata fetch
 # Each entry is a dict with 'type' ('single' or 'chapters'), 'file'/'book', 'track'
@@ -32,11 +55,16 @@ def setProgress(current, total):
     progress_current = current
     progress_total = total
 
-def getProgressPrefix():
-    """Return progress prefix like '10.5% (5/47)' for log messages."""
+def getProgressPrefix(current=None):
+    """
+    Return progress prefix like '10.5% (5/47)' for log messages.
+    current: position to show instead of the shared counter, for work running on a pool thread.
+    """
+    if current is None:
+        current = progress_current
     if progress_total > 0:
-        pct = (progress_current / progress_total) * 100
-        return f"{pct:.1f}% ({progress_current}/{progress_total}) "
+        pct = (current / progress_total) * 100
+        return f"{pct:.1f}% ({current}/{progress_total}) "
     return ""
 
 def isConversionQueued(bookPath):
@@ -45,14 +73,148 @@ def isConversionQueued(bookPath):
     This prevents duplicate processing when one file is queued for conversion
     and another file with the same metadata arrives later.
     """
-    for c in conversions:
-        if c.md.bookPath == bookPath:
-            return c.file.name
-    return None
+    return _queuedByBookPath.get(bookPath)
+
+def _queueConversion(c):
+    """Queue a Conversion and index it by output path for isConversionQueued."""
+    # processFile may run on recursivelyCombineBatch's worker threads
+    with _conversionsLock:
+        conversions.append(c)
+        # setdefault keeps the first file queued for a path, matching the old first-match scan
+        _queuedByBookPath.setdefault(c.md.bookPath, c.file.name)
+
+# Output directories already created this run. Sibling books by one author share a folder,
+# so this skips re-running mkdir(parents=True) for each of them. processFile and processChapterBook
+# call this from recursivelyCombineBatch's worker threads too - threads racing on one path at worst
+# both run the exist_ok mkdir, and set.add is atomic.
+_createdDirs = set()
+
+# Output bookPath -> source name of the book writing there this batch. Single files and chapter books
+# share recursivelyCombineBatch's pool, so "does the output exist / is it queued" and taking the folder
+# must be one step under _claimLock, or two books with the same author/title both write into it.
+_claimedBookPaths = {}
+# Output file paths handed out by _reserveUniquePath this batch (untagged singles, which have no book folder)
+_reservedOutputFiles = set()
+_claimLock = threading.Lock()
+
+def _ensureDir(path):
+    """mkdir -p the given output directory, once per run."""
+    key = str(path)
+    if key not in _createdDirs:
+        Path(key).mkdir(parents=True, exist_ok=True)
+        _createdDirs.add(key)
 
 # Track duplicate version decisions made during processing
 single_file_duplicate_log = []
 
+# Formats where tinytag's fields map cleanly onto getAuthor/getTitle's tag priority
+_TINYTAG_EXTS = ('.mp3', '.m4a', '.m4b', '.flac')
+
+def _quickAuthorTitle(file):
+    """
+    Read (author, title) with tinytag, skipping cover art and duration scanning.
+    Mirrors getAuthor/getTitle's priority: albumartist > artist > composer, album > title.
+    Returns None when tinytag is unavailable or can't give a complete answer, so the caller
+    falls back to a full mutagen read.
+    """
+    if not TINYTAG_AVAILABLE or file.suffix.lower() not in _TINYTAG_EXTS:
+        return None
+    try:
+        tag = TinyTag.get(str(file), duration=False)
+    except Exception:
+        return None
+    author = tag.albumartist or tag.artist or tag.composer
+    title = tag.album or tag.title
+    if not author or not title:
+        # mutagen checks a few more frames (lyricist, TEXT...) - let it decide
+        return None
+    return author, title
+
+def _readDuplicateKey(file):
+    """
+    Grouping key for detectDuplicateSingleFiles: 'author|title' from metadata, lowercased.
+    Files whose metadata can't be read get their own path as key so they're always kept.
+    Runs on worker threads.
+    """
+    quick = _quickAuthorTitle(file)
+    if quick:
+        return f"{quick[0]}|{quick[1]}".lower()
+    try:
+        track = mutagen.File(file, easy=True)
+        if track is None:
+            # Can't read metadata, keep the file
+            return str(file)
+        author = getAuthor(track) or "Unknown"
+        title = getTitle(track) or "Unknown"
+        return f"{author}|{title}".lower()
+    except Exception as e:
+        log.debug(f"Error reading metadata for duplicate detection: {e}")
+        return str(file)
+
+def _userCacheDir():
+    """Per-user cache folder: %LOCALAPPDATA% on Windows, else $XDG_CACHE_HOME or ~/.cache."""
+    base = os.environ.get('LOCALAPPDATA') if sys.platform == 'win32' else os.environ.get('XDG_CACHE_HOME')
+    return Path(base or Path.home() / '.cache') / 'ultimate-audiobooks'
+
+# Duplicate-detection keys from earlier runs: str(path) -> [st_mtime_ns, st_size, key], least recently used first
+# Files that haven't changed since they were last seen skip the tag read entirely
+_dupKeyCacheFile = _userCacheDir() / "duplicate_key_cache.json"
+_dupKeyCacheMax = 200000
+_dupKeyCache = None
+
+def _loadDupKeyCache():
+    """Load the duplicate-key cache from disk on first use."""
+    global _dupKeyCache
+    if _dupKeyCache is not None:
+        return
+    try:
+        with open(_dupKeyCacheFile, 'r', encoding='utf-8') as f:
+            _dupKeyCache = json.load(f)
+    except Exception:
+        _dupKeyCache = {}
+
+def _saveDupKeyCache():
+    """Write the duplicate-key cache atomically, dropping the least recently used entries past _dupKeyCacheMax."""
+    excess = len(_dupKeyCache) - _dupKeyCacheMax
+    if excess > 0:
+        for path in list(islice(_dupKeyCache, excess)):
+            del _dupKeyCache[path]
+    tmpPath = None
+    try:
+        _dupKeyCacheFile.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmpPath = tempfile.mkstemp(dir=_dupKeyCacheFile.parent, prefix=_dupKeyCacheFile.name, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(_dupKeyCache, f)
+        os.replace(tmpPath, _dupKeyCacheFile)
+    except Exception as e:
+        log.debug(f"Could not save duplicate-key cache: {e}")
+        if tmpPath is not None:
+            try:
+                os.unlink(tmpPath)
+            except OSError:
+                pass
+
+def _cachedDuplicateKey(file):
+    """
+    _readDuplicateKey with the on-disk cache in front of it. Runs on worker threads.
+    Returns (key, entry, size) where entry is a fresh cache entry to store, or None on a cache hit
+    or when the key shouldn't be cached, and size is the file size from the same stat (None if it
+    failed) for selectBestVersion.
+    """
+    try:
+        st = file.stat()
+    except OSError:
+        return _readDuplicateKey(file), None, None
+    entry = _dupKeyCache.get(str(file))
+    if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+        return entry[2], None, st.st_size
+    key = _readDuplicateKey(file)
+    if key == str(file):
+        # Unreadable metadata may be transient (permissions, a file still being written) - don't
+        # pin the file outside its duplicate group until its mtime happens to change
+        return key, None, st.st_size
+    return key, [st.st_mtime_ns, st.st_size, key], st.st_size
+
 def detectDuplicateSingleFiles(files):
     """
     Detect duplicate complete audiobook files (e.g., multiple m4b versions).
@@ -72,29 +234,31 @@ def detectDuplicateSingleFiles(files):
         return files
 
     # Group files by their metadata (author + title)
-    groups = {}
+    # Metadata reads are I/O bound and independent, so they run on a thread pool;
+    # results come back in file order and are grouped here on the main thread
+    groups = defaultdict(list)
+    sizes = {}  # file -> st_size from the cache check, reused when picking between duplicates
     totalFiles = len(files)
+    cacheUpdated = False
+    _loadDupKeyCache()
     log.info(f"Checking {totalFiles} files for duplicates (reading metadata)...")
-    for i, file in enumerate(files):
-        if (i + 1) % 25 == 0 or (i + 1) == totalFiles:
-            log.info(f"  Metadata read progress: {i + 1}/{totalFiles}")
-        try:
-            track = mutagen.File(file, easy=True)
-            if track is None:
-                # Can't read metadata, keep the file
-                groups[str(file)] = [file]
-                continue
-
-            author = getAuthor(track) or "Unknown"
-            title = getTitle(track) or "Unknown"
-            key = f"{author}|{title}".lower()
-
-            if key not in groups:
-                groups[key] = []
+    with ThreadPoolExecutor(max_workers=max(1, min(8, totalFiles))) as executor:
+        for i, (file, (key, entry, size)) in enumerate(zip(files, executor.map(_cachedDuplicateKey, files))):
+            if (i + 1) % 25 == 0 or (i + 1) == totalFiles:
+                log.info("  Metadata read progress: %s/%s", i + 1, totalFiles)
             groups[key].append(file)
-        except Exception as e:
-            log.debug(f"Error reading metadata for duplicate detection: {e}")
-            groups[str(file)] = [file]
+            sizes[file] = size
+            path = str(file)
+            if entry is not None:
+                _dupKeyCache.pop(path, None)
+                _dupKeyCache[path] = entry
+                cacheUpdated = True
+            elif path in _dupKeyCache:
+                # Re-insert hits so insertion order stays least-recently-used first for the trim
+                _dupKeyCache[path] = _dupKeyCache.pop(path)
+                cacheUpdated = True
+    if cacheUpdated:
+        _saveDupKeyCache()
 
     # Select best version from each group
     result = []
@@ -103,48 +267,45 @@ def detectDuplicateSingleFiles(files):
             result.append(group_files[0])
         else:
             # Check if files look like numbered chapters (e.g., 01_, 02_, Track 1, etc.)
-            import re
             numbered_files = []
             for f in group_files:
                 # Look for leading numbers in filename
-                if re.match(r'^(\d+[-_\s]|track\s*\d+|chapter\s*\d+|part\s*\d+)', f.stem, re.IGNORECASE):
+                if _CHAPTER_RE.match(f.stem):
                     numbered_files.append(f)
 
             # If most files look like numbered chapters, warn user instead of treating as duplicates
             if len(numbered_files) >= len(group_files) * 0.6:  # 60% or more have numbers
                 # Find common parent folder (grandparent of the files since they're in chapter subfolders)
                 common_parent = group_files[0].parent.parent
-                log.warning(f"POSSIBLE CHAPTER FILES in separate folders:")
-                log.warning(f"  Location: {common_parent}")
-                log.warning(f"  These {len(group_files)} files look like chapters of the same book but are in different folders:")
+                log.warning("POSSIBLE CHAPTER FILES in separate folders:")
+                log.warning("  Location: %s", common_parent)
+                log.warning("  These %s files look like chapters of the same book but are in different folders:", len(group_files))
                 for f in sorted(group_files, key=lambda x: x.stem):
-                    log.warning(f"    - {f.parent.name}/{f.name}")
-                log.warning(f"  Consider moving them into a single folder so they can be merged.")
+                    log.warning("    - %s/%s", f.parent.name, f.name)
+                log.warning("  Consider moving them into a single folder so they can be merged.")
                 # Still process all of them individually since we can't merge across folders
                 result.extend(group_files)
                 continue
 
             # Multiple files with same metadata - select best version
-            selected = selectBestVersion(group_files, key)
+            selected = selectBestVersion(group_files, key, sizes)
             result.append(selected)
 
             # Log the decision
             skipped = [f for f in group_files if f != selected]
             if skipped:
                 # Check if filenames look unrelated (possible metadata mismatch)
-                selectedStem = selected.stem.lower()
+                # If filenames share no common words (3+ chars), likely a metadata error
+                selectedWords = set(w for w in _WORD_SPLIT_RE.split(selected.stem.lower()) if len(w) >= 3)
                 for skippedFile in skipped:
-                    skippedStem = skippedFile.stem.lower()
-                    # If filenames share no common words (3+ chars), likely a metadata error
-                    selectedWords = set(w for w in selectedStem.replace('-', ' ').replace('_', ' ').split() if len(w) >= 3)
-                    skippedWords = set(w for w in skippedStem.replace('-', ' ').replace('_', ' ').split() if len(w) >= 3)
-                    if not selectedWords.intersection(skippedWords):
-                        log.warning(f"POSSIBLE METADATA ERROR: '{skippedFile.name}' has metadata claiming it's '{key}'")
-                        log.warning(f"  This file may have incorrect ID3 tags - please verify and fix manually")
-
-                log.warning(f"Multiple files with same metadata: {key}")
-                log.info(f"  Selected: {selected.name}")
-                log.info(f"  Skipped (duplicate metadata): {[f.name for f in skipped]}")
+                    skippedWords = set(w for w in _WORD_SPLIT_RE.split(skippedFile.stem.lower()) if len(w) >= 3)
+                    if selectedWords.isdisjoint(skippedWords):
+                        log.warning("POSSIBLE METADATA ERROR: '%s' has metadata claiming it's '%s'", skippedFile.name, key)
+                        log.warning("  This file may have incorrect ID3 tags - please verify and fix manually")
+
+                log.warning("Multiple files with same metadata: %s", key)
+                log.info("  Selected: %s", selected.name)
+                log.info("  Skipped (duplicate metadata): %s", [f.name for f in skipped])
                 single_file_duplicate_log.append({
                     "selected": selected.name,
                     "selected_type": selected.suffix,
@@ -155,75 +316,82 @@ def detectDuplicateSingleFiles(files):
 
     return result
 
-def selectBestVersion(files, key):
+# Priority order for file types when picking between duplicate versions (lower = better)
+_VERSION_PRIORITY = {'.m4b': 1, '.m4a': 2, '.flac': 3, '.wav': 4, '.mp3': 5}
+
+def selectBestVersion(files, key, sizes=None):
     """
     Select the best version from a list of files representing the same audiobook.
     Priority: m4b > m4a > flac > wav > mp3 > others
+    sizes: optional {file: st_size} already gathered by the caller, to skip re-stat'ing
     """
-    # Priority order for file types (lower = better)
-    priority = {'.m4b': 1, '.m4a': 2, '.flac': 3, '.wav': 4, '.mp3': 5}
-
-    # Sort by priority, then by file size (larger = better quality typically)
+    # Rank by priority, then by file size (larger = better quality typically)
     def sort_key(f):
-        ext_priority = priority.get(f.suffix.lower(), 99)
-        try:
-            size = f.stat().st_size
-        except:
-            size = 0
+        ext_priority = _VERSION_PRIORITY.get(f.suffix.lower(), 99)
+        size = sizes.get(f) if sizes else None
+        if size is None:
+            try:
+                size = f.stat().st_size
+            except:
+                size = 0
         return (ext_priority, -size)  # Negative size so larger files come first
 
-    sorted_files = sorted(files, key=sort_key)
-    return sorted_files[0]
+    # min() keeps the first of equal-ranked files, same as taking sorted()[0]
+    return min(files, key=sort_key)
 
 def printDuplicateVersionSummary():
     """Print a summary of all duplicate version decisions made during processing."""
-    from FileMerger import getDuplicateVersionLog
-
     chapter_log = getDuplicateVersionLog()
 
     if not chapter_log and not single_file_duplicate_log:
         return
 
-    log.info("")
-    log.info("=" * 60)
-    log.info("DUPLICATE VERSION SUMMARY")
-    log.info("=" * 60)
+    # Built up and logged as one record - one trip through the handlers instead of one per line
+    lines = ["", "=" * 60, "DUPLICATE VERSION SUMMARY", "=" * 60]
 
     if chapter_log:
-        log.info("")
-        log.info("Chapter folder duplicates (alternate versions in same folder):")
+        lines.append("")
+        lines.append("Chapter folder duplicates (alternate versions in same folder):")
         for entry in chapter_log:
             folder = entry.get('folder', 'Unknown')
             selected = entry.get('selected', 'Unknown')
             skipped = entry.get('skipped_count', 0)
-            log.info(f"  {folder}:")
-            log.info(f"    Selected: {selected}")
-            log.info(f"    Skipped: {skipped} files")
+            lines.append(f"  {folder}:")
+            lines.append(f"    Selected: {selected}")
+            lines.append(f"    Skipped: {skipped} files")
             if 'all_patterns' in entry:
-                log.info(f"    Patterns found: {entry['all_patterns']}")
+                lines.append(f"    Patterns found: {entry['all_patterns']}")
 
     if single_file_duplicate_log:
-        log.info("")
-        log.info("Single file duplicates (same author|title metadata):")
+        lines.append("")
+        lines.append("Single file duplicates (same author|title metadata):")
         for entry in single_file_duplicate_log:
             key = entry.get('key', 'Unknown')
             selected = entry.get('selected', 'Unknown')
             skipped = entry.get('skipped_files', [])
-            log.info(f"  {key}:")
-            log.info(f"    Selected: {selected}")
-            log.info(f"    Skipped: {skipped}")
+            lines.append(f"  {key}:")
+            lines.append(f"    Selected: {selected}")
+            lines.append(f"    Skipped: {skipped}")
 
-    log.info("")
-    log.info("=" * 60)
+    lines.append("")
+    lines.append("=" * 60)
+    log.info("\n".join(lines))
 
 def loadSettings():
     global settings
     settings = getSettings()
 
-def processConversion(c, settings): #This is run through ProcessPoolExecutor, which limits access to globals
+# Settings for conversion worker processes, set once per worker by _initConversionWorker
+_workerSettings = None
+
+def _initConversionWorker(s):
+    global _workerSettings
+    _workerSettings = s
+
+def processConversion(c): #This is run through ProcessPoolExecutor, which limits access to globals
+    settings = _workerSettings
     file = c.file
     type = c.type
-    track = c.track
     md = c.md
     sourceFolderPath = c.sourceFolderPath
 
@@ -254,18 +422,25 @@ def processConversions():
             numWorkers = 1
             log.info("Number of workers not specified and unable to retrieve relevant system information. Defaulting to 1 worker.")
 
-    controller = ProcessPoolExecutor(max_workers=numWorkers)
+    # Hand settings to each worker once at startup rather than pickling them with every task
+    controller = ProcessPoolExecutor(max_workers=numWorkers, initializer=_initConversionWorker, initargs=(settings,))
     try:
-        futures = [controller.submit(processConversion, c, settings) for c in conversions]
+        pending = {controller.submit(processConversion, c): c for c in conversions}
+        futures = set(pending)
+        total = len(futures)
+        completed = 0
 
         # Use a loop with timeout to allow KeyboardInterrupt
         while futures:
             done, futures = wait(futures, timeout=1.0, return_when='FIRST_COMPLETED')
             for future in done:
+                completed += 1
+                setProgress(completed, total)
                 try:
                     future.result()
+                    log.info("%sConverted: %s", getProgressPrefix(), pending[future].file.name)
                 except Exception as e:
-                    log.error("Error processing conversion: " + str(e))
+                    log.error("%sError processing conversion of %s: %s", getProgressPrefix(), pending[future].file.name, e)
     except KeyboardInterrupt:
         log.warning("\nCtrl+C detected - shutting down conversion workers...")
         # Cancel pending futures
@@ -288,6 +463,10 @@ def processConversions():
         if not controller._shutdown:
             controller.shutdown(wait=True)
 
+    # Everything queued so far has been handled - don't convert it again on the next batch
+    conversions.clear()
+    _queuedByBookPath.clear()
+
 def processDeferredBooks():
     """
     Process books that were deferred during the auto-fetch phase.
@@ -305,7 +484,7 @@ def processDeferredBooks():
     total = len(deferredBooks)
     for i, deferred in enumerate(deferredBooks, 1):
         setProgress(i, total)
-        log.info(f"Deferred {i}/{total}: Processing...")
+        log.info("Deferred %s/%s: Processing...", i, total)
 
         if deferred['type'] == 'single':
             processDeferredSingleFile(deferred['file'], deferred['track'])
@@ -319,6 +498,17 @@ def processDeferredBooks():
     if len(conversions) > 0:
         processConversions()
 
+def _copyToOutput(file, newPath, md, coverFolder):
+    """
+    Copy-mode output for a single file: copy it, write fetched metadata to the copy only
+    (the source stays untouched), then bring the cover image along.
+    """
+    log.info(f"Copying '{file.name}' to {newPath}")
+    fastCopy(file, newPath)
+    if settings.fetch:
+        cleanMetadata(mutagen.File(newPath, easy=True), md)
+    copyCoverImage(coverFolder, md.bookPath)
+
 def processDeferredSingleFile(file, track):
     """Process a single file that was deferred for interactive metadata fetch."""
     file_type = Path(file).suffix.lower()
@@ -356,41 +546,37 @@ def processDeferredSingleFile(file, track):
     # Build output path
     cleanAuthor = cleanAuthorForPath(md.author)
     cleanTitle = cleanTitleForPath(md.title)
-    md.bookPath = settings.output + f"/{cleanAuthor}/{cleanTitle}"
+    bookDir = bookOutputPath(cleanAuthor, cleanTitle)
+    md.bookPath = str(bookDir)
 
     # Check if output already exists
     # If -CV mode, only .m4b counts as existing output
-    existingFile = checkOutputExists(md.bookPath, md.title, requireM4B=settings.convert)
+    existingFile = checkOutputExists(bookDir, md.title, requireM4B=settings.convert)
     if existingFile:
         skipBook(file, f"Output already exists: {existingFile.name}")
         return
 
     # Create output directory
-    Path(md.bookPath).mkdir(parents=True, exist_ok=True)
+    _ensureDir(md.bookPath)
 
     # Determine output path
-    newPath = Path(md.bookPath) / Path(cleanTitle).with_suffix(file_type)
+    newPath = bookDir / Path(cleanTitle).with_suffix(file_type)
 
     # Convert to m4b if needed
     shouldConvert = (settings.convert or isMergedFromChapters(file)) and file_type != '.m4b'
     if shouldConvert:
-        from BookStatus import getOriginalPath
         originalPath = getOriginalPath(file)
         sourceFolderPath = str(originalPath) if originalPath and originalPath.is_dir() else str(file.parent)
-        conversions.append(Conversion(file, track, file_type, md, sourceFolderPath))
+        _queueConversion(Conversion(file, track, file_type, md, sourceFolderPath))
         return
 
     # Copy/move file
     if settings.move:
         log.info(f"Moving '{file.name}' to {newPath}")
-        file.rename(newPath)
+        moveFile(file, newPath)
         copyCoverImage(file.parent, md.bookPath)
     else:
-        log.info(f"Copying '{file.name}' to {newPath}")
-        shutil.copy(file, newPath)
-        if settings.fetch:
-            cleanMetadata(mutagen.File(newPath, easy=True), md)
-        copyCoverImage(file.parent, md.bookPath)
+        _copyToOutput(file, newPath, md, file.parent)
 
 def processDeferredChapterBook(book, track):
     """Process a chapter book that was deferred for interactive metadata fetch."""
@@ -447,35 +633,38 @@ def processDeferredChapterBook(book, track):
                 if chapterTrack:
                     cleanMetadata(chapterTrack, md)
             except Exception as e:
-                log.warning(f"Could not update metadata for {chapterFile.name}: {e}")
+                log.warning("Could not update metadata for %s: %s", chapterFile.name, e)
         return
 
     # Build output path
     cleanAuthor = cleanAuthorForPath(md.author)
     cleanTitle = cleanTitleForPath(md.title)
-    bookPath = settings.output + f"/{cleanAuthor}/{cleanTitle}"
+    bookPath = bookOutputPath(cleanAuthor, cleanTitle)
 
     # Check if output already exists
     # If -CV mode, only .m4b counts as existing output
-    existingFile = checkOutputExists(bookPath, md.title, requireM4B=settings.convert)
+    # One listing of the output folder answers this and the M4B / leftover-file checks below
+    outputNames = listOutputFolder(bookPath)
+    existingFile = checkOutputExists(bookPath, md.title, requireM4B=settings.convert, names=outputNames)
     if existingFile:
         skipBook(sourcePath, f"Output already exists: {existingFile.name}")
         return
 
     # Create output directory
-    Path(bookPath).mkdir(parents=True, exist_ok=True)
+    _ensureDir(bookPath)
 
     # Merge directly to output - always M4B to preserve chapters
-    finalOutputPath = Path(bookPath) / (cleanTitle + '.m4b')
+    finalOutputPath = bookPath / (cleanTitle + '.m4b')
 
     # Check if M4B already exists
-    if finalOutputPath.exists():
+    presentNames = {os.path.normcase(name) for name in outputNames}
+    if os.path.normcase(finalOutputPath.name) in presentNames:
         log.info(f"M4B already exists: {finalOutputPath.name}, skipping")
         return
 
     # Check for old intermediate MP3 from previous incomplete runs
-    oldMp3Path = Path(bookPath) / (cleanTitle + Path(files[0]).suffix.lower())
-    if oldMp3Path.exists() and oldMp3Path.suffix.lower() != '.m4b':
+    oldMp3Path = bookPath / (cleanTitle + Path(files[0]).suffix.lower())
+    if oldMp3Path.suffix.lower() != '.m4b' and os.path.normcase(oldMp3Path.name) in presentNames:
         log.info(f"Found old intermediate file {oldMp3Path.name}, deleting to re-merge with chapters")
         oldMp3Path.unlink()
 
@@ -494,18 +683,118 @@ def processDeferredChapterBook(book, track):
         except Exception as e:
             log.warning(f"Could not update metadata on merged file: {e}")
 
-def processFile(file):
+def _sourceFolder(file):
+    """Folder a file originally came from, for cover image lookup (it may have been moved to temp)."""
+    originalPath = getOriginalPath(file)
+    # For merged chapter books, originalPath is the book folder itself
+    # For single files, originalPath is the file, so we need .parent
+    if originalPath:
+        return originalPath if originalPath.is_dir() else originalPath.parent
+    return file.parent
+
+def _claimBookPath(bookPath, title, sourceName, names=None):
+    """
+    Check that no existing output, queued conversion or other book in this batch already occupies
+    bookPath, and claim it for sourceName - atomically, under _claimLock.
+    Returns the reason to skip the book, or None once the folder is claimed.
+    """
+    key = str(bookPath)
+    with _claimLock:
+        # If -CV mode, only .m4b counts as existing output
+        existingFile = checkOutputExists(bookPath, title, requireM4B=settings.convert, names=names)
+        if existingFile:
+            return f"Output already exists: {existingFile.name}"
+        queuedFile = isConversionQueued(key)
+        if queuedFile:
+            return f"Conversion already queued: {queuedFile}"
+        claimedBy = _claimedBookPaths.get(key)
+        if claimedBy:
+            return f"Output already being written by: {claimedBy}"
+        _claimedBookPaths[key] = sourceName
+    return None
+
+def _reserveUniquePath(fileName, outpath):
+    """
+    getUniquePath for a file running on the pool: picking the free name and reserving it is one step
+    under _claimLock, so two untagged '01.mp3's from different folders don't both land on one path.
+    """
+    with _claimLock:
+        newPath = getUniquePath(fileName, outpath, _reservedOutputFiles)
+        _reservedOutputFiles.add(str(newPath))
+    return newPath
+
+def _claimOutputPath(file, md):
+    """
+    Point md.bookPath at the output folder for md.author/md.title, skip the file if that book
+    already exists there or is queued for conversion, and create the folder.
+    Returns the folder Path, or None if the file was skipped.
+    """
+    # Clean author name for path (strips credits, replaces slashes, removes invalid chars)
+    bookDir = bookOutputPath(cleanAuthorForPath(md.author), cleanTitleForPath(md.title))
+    md.bookPath = str(bookDir)
+
+    skipReason = _claimBookPath(bookDir, md.title, file.name)
+    if skipReason:
+        skipBook(file, skipReason)
+        return None
+
+    log.debug(f"Making directory {md.bookPath} if not exists")
+    _ensureDir(md.bookPath)
+    return bookDir
+
+# Tag reads kept in flight ahead of the serial processFile loop in _processFiles
+_TRACK_READ_AHEAD = 4
+
+def _openTrack(file):
+    """
+    mutagen.File(file, easy=True) for the _processFiles read-ahead pool.
+    Returns (track, None), or (None, exception) so processFile can report the error itself.
+    """
+    try:
+        return mutagen.File(file, easy=True), None
+    except Exception as e:
+        return None, e
+
+def _processFiles(files):
+    """
+    Run processFile over files in order while the next few files' tags are read on worker threads.
+    processFile itself stays serial - it may prompt, and it queues conversions and deferred books.
+    """
+    total = len(files)
+    pending = deque()
+    nextIndex = 0
+    with ThreadPoolExecutor(max_workers=_TRACK_READ_AHEAD) as executor:
+        for i, file in enumerate(files, 1):
+            while nextIndex < total and len(pending) < _TRACK_READ_AHEAD * 2:
+                pending.append(executor.submit(_openTrack, files[nextIndex]))
+                nextIndex += 1
+            opened = pending.popleft().result()
+            setProgress(i, total)
+            processFile(file, opened)
+
+def processFile(file, opened=None, position=None):
+    """
+    opened: optional (track, error) result of _openTrack(file), read ahead by _processFiles.
+    position: this file's place in the batch when run on a pool thread, where the shared progress
+    counter belongs to the main thread.
+    """
     # Show parent folder for context (e.g., "Author/Book.mp3")
     parentName = file.parent.name if file.parent else ""
-    prefix = getProgressPrefix()
+    prefix = getProgressPrefix(position)
     log.info(f"{prefix}Processing {parentName}/{file.name}" if parentName else f"{prefix}Processing {file.name}")
     file_type = Path(file).suffix.lower()
     md = Metadata()
     md.bookPath = settings.output
     newPath = ""
+    claimed = False  # md.bookPath already checked and created by _claimOutputPath
 
     try:
-        track = mutagen.File(file, easy=True)
+        if opened is None:
+            track = mutagen.File(file, easy=True)
+        else:
+            track, error = opened
+            if error is not None:
+                raise error
     except mutagen.mp3.HeaderNotFoundError:
         failBook(file, "Corrupt or unreadable audio file")
         return
@@ -529,26 +818,13 @@ def processFile(file):
         if author and title:
             md.author = author
             md.title = title
-            # Clean author name for path (strips credits, replaces slashes, removes invalid chars)
-            cleanAuthor = cleanAuthorForPath(author)
-            cleanTitle = cleanTitleForPath(title)
-            md.bookPath = settings.output + f"/{cleanAuthor}/{cleanTitle}"
-
-            # Check if output already exists or is queued for conversion - skip if so
-            # Skip this check in in-place mode since output = input
-            # If -CV mode, only .m4b counts as existing output
-            if not settings.inPlace:
-                existingFile = checkOutputExists(md.bookPath, title, requireM4B=settings.convert)
-                if existingFile:
-                    skipBook(file, f"Output already exists: {existingFile.name}")
-                    return
-                queuedFile = isConversionQueued(md.bookPath)
-                if queuedFile:
-                    skipBook(file, f"Conversion already queued: {queuedFile}")
-                    return
-
-                log.debug(f"Making directory {md.bookPath} if not exists")
-                Path(md.bookPath).mkdir(parents = True, exist_ok = True)
+            # Skip the output check in in-place mode since output = input
+            if settings.inPlace:
+                md.bookPath = str(bookOutputPath(cleanAuthorForPath(author), cleanTitleForPath(title)))
+            elif _claimOutputPath(file, md) is None:
+                return
+            else:
+                claimed = True
 
     # Handle fetch/fetchUpdate mode - only fetch if metadata is incomplete
     shouldFetch = False
@@ -562,25 +838,11 @@ def processFile(file):
                 return
 
             # Non-in-place mode: set up bookPath with author/title from existing metadata
+            # (already done above from the same tags unless fetch was set)
             md.author = assessment['author']
             md.title = assessment['title']
-            cleanAuthor = cleanAuthorForPath(md.author)
-            cleanTitle = cleanTitleForPath(md.title)
-            md.bookPath = settings.output + f"/{cleanAuthor}/{cleanTitle}"
-
-            # Check if output already exists or is queued for conversion - skip if so
-            # If -CV mode, only .m4b counts as existing output
-            existingFile = checkOutputExists(md.bookPath, md.title, requireM4B=settings.convert)
-            if existingFile:
-                skipBook(file, f"Output already exists: {existingFile.name}")
-                return
-            queuedFile = isConversionQueued(md.bookPath)
-            if queuedFile:
-                skipBook(file, f"Conversion already queued: {queuedFile}")
+            if not claimed and _claimOutputPath(file, md) is None:
                 return
-
-            log.debug(f"Making directory {md.bookPath} if not exists")
-            Path(md.bookPath).mkdir(parents = True, exist_ok = True)
         else:
             log.info(f"Metadata incomplete for {file.name} - missing: {assessment['missing']}")
             # Use fetchUpdate value if set, otherwise use fetch value
@@ -596,7 +858,7 @@ def processFile(file):
         if assessment and assessment.get('author') and assessment.get('title'):
             metaAuthor = cleanAuthorForPath(assessment['author'])
             metaTitle = cleanTitleForPath(assessment['title'])
-            potentialOutputPath = settings.output + f"/{metaAuthor}/{metaTitle}"
+            potentialOutputPath = bookOutputPath(metaAuthor, metaTitle)
             existingFile = checkOutputExists(potentialOutputPath, assessment['title'], requireM4B=settings.convert)
             if existingFile:
                 skipBook(file, f"Output already exists: {existingFile.name}")
@@ -606,7 +868,7 @@ def processFile(file):
         sourceTitleFolder = file.parent.name
         sourceAuthorFolder = file.parent.parent.name if file.parent.parent else None
         if sourceAuthorFolder:
-            potentialOutputPath = settings.output + f"/{sourceAuthorFolder}/{sourceTitleFolder}"
+            potentialOutputPath = bookOutputPath(sourceAuthorFolder, sourceTitleFolder)
             existingFile = checkOutputExists(potentialOutputPath, sourceTitleFolder, requireM4B=settings.convert)
             if existingFile:
                 skipBook(file, f"Output already exists (from folder structure): {existingFile.name}")
@@ -665,25 +927,10 @@ def processFile(file):
             return
 
         #TODO (rename) set md.bookPath according to rename
-        # Clean author name for path (strips credits, replaces slashes, removes invalid chars)
-        cleanAuthor = cleanAuthorForPath(md.author)
-        cleanTitle = cleanTitleForPath(md.title)
-        md.bookPath = settings.output + f"/{cleanAuthor}/{cleanTitle}"
-
-        # Check if output already exists or is queued for conversion - skip if so
-        # If -CV mode, only .m4b counts as existing output
-        existingFile = checkOutputExists(md.bookPath, md.title, requireM4B=settings.convert)
-        if existingFile:
-            skipBook(file, f"Output already exists: {existingFile.name}")
-            return
-        queuedFile = isConversionQueued(md.bookPath)
-        if queuedFile:
-            skipBook(file, f"Conversion already queued: {queuedFile}")
+        bookDir = _claimOutputPath(file, md)
+        if bookDir is None:
             return
 
-        log.debug(f"Making directory {md.bookPath} if not exists")
-        Path(md.bookPath).mkdir(parents = True, exist_ok = True)
-
         if settings.create:
             createOpf(md)
 
@@ -695,19 +942,12 @@ def processFile(file):
             else:
                 log.debug(f"Queueing {file.name} for conversion")
             # Get original source folder path for cover image
-            from BookStatus import getOriginalPath
-            originalPath = getOriginalPath(file)
-            # For merged chapter books, originalPath is the book folder itself
-            # For single files, originalPath is the file, so we need .parent
-            if originalPath:
-                sourceFolderPath = str(originalPath) if originalPath.is_dir() else str(originalPath.parent)
-            else:
-                sourceFolderPath = str(file.parent)
+            sourceFolderPath = str(_sourceFolder(file))
             log.info(f"Queueing conversion with source folder: {sourceFolderPath}")
-            conversions.append(Conversion(file, track, file_type, md, sourceFolderPath))
+            _queueConversion(Conversion(file, track, file_type, md, sourceFolderPath))
             return
         else:
-            newPath = Path(md.bookPath) / Path(cleanTitle).with_suffix(file_type)
+            newPath = bookDir / Path(cleanTitleForPath(md.title)).with_suffix(file_type)
 
         if settings.clean and settings.move:
             #if copying, we will only clean the copied file
@@ -719,16 +959,9 @@ def processFile(file):
         if isMergedFromChapters(file) and not settings.convert:
             log.info(f"Auto-converting merged chapter book to m4b: {file.name}")
         # Get original source folder path for cover image
-        from BookStatus import getOriginalPath
-        originalPath = getOriginalPath(file)
-        # For merged chapter books, originalPath is the book folder itself
-        # For single files, originalPath is the file, so we need .parent
-        if originalPath:
-            sourceFolderPath = str(originalPath) if originalPath.is_dir() else str(originalPath.parent)
-        else:
-            sourceFolderPath = str(file.parent)
+        sourceFolderPath = str(_sourceFolder(file))
         log.info(f"Queueing conversion with source folder: {sourceFolderPath}")
-        conversions.append(Conversion(file, track, file_type, md, sourceFolderPath))
+        _queueConversion(Conversion(file, track, file_type, md, sourceFolderPath))
         return
 
     if settings.rename:
@@ -742,33 +975,19 @@ def processFile(file):
             cleanTitle = cleanTitleForPath(md.title)
             newPath = Path(md.bookPath) / (cleanTitle + file_type)
         else:
-            newPath = getUniquePath(file.name, md.bookPath)
+            newPath = _reserveUniquePath(file.name, md.bookPath)
 
     # Get source folder for cover image lookup
-    from BookStatus import getOriginalPath
-    originalPath = getOriginalPath(file)
-    # For merged chapter books, originalPath is the book folder itself
-    # For single files, originalPath is the file, so we need .parent
-    if originalPath:
-        sourceFolderPath = originalPath if originalPath.is_dir() else originalPath.parent
-    else:
-        sourceFolderPath = file.parent
+    sourceFolderPath = _sourceFolder(file)
 
     if settings.move:
         log.info(f"Moving '{file.name}' to {newPath}")
         # TODO (rename) temporarily use title while working on rename
-        file.rename(newPath)
+        moveFile(file, newPath)
         # Copy cover image to output folder
         copyCoverImage(sourceFolderPath, md.bookPath)
     else:
-        log.info(f"Copying '{file.name}' to {newPath}")
-        shutil.copy(file, newPath)
-
-        if settings.fetch:
-            cleanMetadata(mutagen.File(newPath, easy=True), md)
-
-        # Copy cover image to output folder
-        copyCoverImage(sourceFolderPath, md.bookPath)
+        _copyToOutput(file, newPath, md, sourceFolderPath)
 
         # Clean up temp file after copying to output
         _deleteTempFile(file)
@@ -821,7 +1040,7 @@ def processChapterBook(book):
         if existingAuthor and existingTitle:
             metaAuthor = cleanAuthorForPath(existingAuthor)
             metaTitle = cleanTitleForPath(existingTitle)
-            potentialOutputPath = settings.output + f"/{metaAuthor}/{metaTitle}"
+            potentialOutputPath = bookOutputPath(metaAuthor, metaTitle)
             # If -CV mode, only .m4b counts as existing output
             existingFile = checkOutputExists(potentialOutputPath, existingTitle, requireM4B=settings.convert)
             if existingFile:
@@ -880,9 +1099,9 @@ def processChapterBook(book):
                     chapterTrack = mutagen.File(chapterFile, easy=True)
                     if chapterTrack:
                         cleanMetadata(chapterTrack, md)
-                        log.debug(f"Updated metadata for: {chapterFile.name}")
+                        log.debug("Updated metadata for: %s", chapterFile.name)
                 except Exception as e:
-                    log.warning(f"Could not update metadata for {chapterFile.name}: {e}")
+                    log.warning("Could not update metadata for %s: %s", chapterFile.name, e)
             log.info(f"Metadata updated in-place for {len(files)} chapter files")
             return
 
@@ -921,37 +1140,35 @@ def processChapterBook(book):
     # Clean for path
     cleanAuthor = cleanAuthorForPath(author)
     cleanTitle = cleanTitleForPath(title)
-    bookPath = settings.output + f"/{cleanAuthor}/{cleanTitle}"
+    bookPath = bookOutputPath(cleanAuthor, cleanTitle)
 
     # Check if output already exists
     # If -CV mode, only .m4b counts as existing output
-    existingFile = checkOutputExists(bookPath, title, requireM4B=settings.convert)
-    if existingFile:
-        skipBook(sourcePath, f"Output already exists: {existingFile.name}")
-        return
-
-    # Check if already queued for conversion
-    queuedFile = isConversionQueued(bookPath)
-    if queuedFile:
-        skipBook(sourcePath, f"Conversion already queued: {queuedFile}")
+    # One listing of the output folder answers this and the M4B / leftover-file checks below
+    # Also checks for a queued conversion, and claims bookPath against single files on the same pool
+    outputNames = listOutputFolder(bookPath)
+    skipReason = _claimBookPath(bookPath, title, sourcePath.name, names=outputNames)
+    if skipReason:
+        skipBook(sourcePath, skipReason)
         return
 
     # Create output directory
     log.debug(f"Making directory {bookPath} if not exists")
-    Path(bookPath).mkdir(parents=True, exist_ok=True)
+    _ensureDir(bookPath)
 
     # Determine final output file path
     # mergeBook always outputs M4B to preserve chapters
-    finalOutputPath = Path(bookPath) / (cleanTitle + '.m4b')
+    finalOutputPath = bookPath / (cleanTitle + '.m4b')
 
     # Check if M4B already exists (from previous run)
-    if finalOutputPath.exists():
+    presentNames = {os.path.normcase(name) for name in outputNames}
+    if os.path.normcase(finalOutputPath.name) in presentNames:
         log.info(f"M4B already exists: {finalOutputPath.name}, skipping")
         return
 
     # Check for old intermediate MP3 from previous incomplete runs
-    oldMp3Path = Path(bookPath) / (cleanTitle + Path(files[0]).suffix.lower())
-    if oldMp3Path.exists() and oldMp3Path.suffix.lower() != '.m4b':
+    oldMp3Path = bookPath / (cleanTitle + Path(files[0]).suffix.lower())
+    if oldMp3Path.suffix.lower() != '.m4b' and os.path.normcase(oldMp3Path.name) in presentNames:
         log.info(f"Found old intermediate file {oldMp3Path.name}, deleting to re-merge with chapters")
         oldMp3Path.unlink()
 
@@ -979,12 +1196,39 @@ def recursivelyCombineBatch(offset=0):
     Args:
         offset: Number of books to skip (for batch continuation)
     """
+    # Loop rather than recurse per batch, so a finished batch's books and futures are freed
+    # while the user decides whether to continue
+    try:
+        while offset is not None:
+            offset = _recursivelyCombineOneBatch(offset)
+    finally:
+        _shutdownCombineExecutor()
+
+def _getCombineExecutor(numWorkers):
+    """Thread pool for chapter-book merges, created on first use and kept warm across batches."""
+    global _combineExecutor
+    if _combineExecutor is None:
+        _combineExecutor = ThreadPoolExecutor(max_workers=numWorkers)
+    return _combineExecutor
+
+def _shutdownCombineExecutor(wait=True, cancel_futures=False):
+    global _combineExecutor
+    if _combineExecutor is not None:
+        _combineExecutor.shutdown(wait=wait, cancel_futures=cancel_futures)
+        _combineExecutor = None
+
+def _recursivelyCombineOneBatch(offset):
+    """Process one recursivelyCombineBatch batch. Returns the next batch's offset, or None to stop."""
     log.info("Begin recursively finding and processing chapter books (no temp folder)")
     log.info("PHASE 1: Auto-fetch only (no user interaction)")
     infolder = Path(settings.input)
 
-    # Clear duplicate version logs and deferred list at start of processing
+    # Clear duplicate version logs, fail marker cache, and deferred list at start of processing
     clearDuplicateVersionLog()
+    clearFailMarkerCache()
+    clearCoverCache()
+    _claimedBookPaths.clear()
+    _reservedOutputFiles.clear()
     global single_file_duplicate_log, deferredBooks
     single_file_duplicate_log = []
     deferredBooks = []
@@ -994,7 +1238,7 @@ def recursivelyCombineBatch(offset=0):
 
     if len(books) == 0:
         log.info("No more books to process.")
-        return
+        return None
 
     # Separate single files and chapter books
     singleFiles = [b for b in books if b['type'] == 'single']
@@ -1012,21 +1256,28 @@ def recursivelyCombineBatch(offset=0):
     total = len(singleFilePaths) + len(chapterBooks)
     current = 0
 
-    # Process single files (sequential - usually quick, just copying)
-    for file in singleFilePaths:
-        current += 1
-        setProgress(current, total)
-        processFile(file)
+    # Single files are I/O bound (tag read, copy/move) and can share the pool with the chapter books -
+    # unless metadata fetching is on: that path drives the shared Selenium browser and temporarily
+    # rewrites settings.fetch, so it stays sequential on this thread
+    parallelSingles = not (settings.fetch or settings.fetchUpdate)
+    if not parallelSingles:
+        for file in singleFilePaths:
+            current += 1
+            setProgress(current, total)
+            processFile(file)
 
     # Process chapter books in parallel (merging is CPU-intensive)
     numWorkers = settings.workers if settings.workers > 0 else 2
-    if chapterBooks:
-        log.info(f"Processing {len(chapterBooks)} chapter books with {numWorkers} parallel workers")
+    pooledFiles = singleFilePaths if parallelSingles else []
+    if chapterBooks or pooledFiles:
+        log.info(f"Processing {len(chapterBooks)} chapter books and {len(pooledFiles)} single files with {numWorkers} parallel workers")
 
-        executor = ThreadPoolExecutor(max_workers=numWorkers)
+        executor = _getCombineExecutor(numWorkers)
         try:
-            # Submit all chapter book jobs
+            # Submit all jobs, remembering what each one was for error reporting
             futures_dict = {executor.submit(processChapterBook, book): book for book in chapterBooks}
+            futures_dict.update({executor.submit(processFile, file, None, current + len(chapterBooks) + i): {'source_file': file}
+                                 for i, file in enumerate(pooledFiles, 1)})
             futures_set = set(futures_dict.keys())
 
             # Process results as they complete with timeout loop to allow KeyboardInterrupt
@@ -1039,7 +1290,10 @@ def recursivelyCombineBatch(offset=0):
                         future.result()
                     except Exception as e:
                         book = futures_dict[future]
-                        log.error(f"Error processing chapter book {book.get('source_path', 'unknown')}: {e}")
+                        if 'source_file' in book:
+                            log.error("Error processing file %s: %s", book['source_file'], e)
+                        else:
+                            log.error("Error processing chapter book %s: %s", book.get('source_path', 'unknown'), e)
         except KeyboardInterrupt:
             log.warning("\nCtrl+C detected - shutting down workers...")
             # Cancel pending futures
@@ -1054,13 +1308,9 @@ def recursivelyCombineBatch(offset=0):
             except:
                 pass
             # Shutdown without waiting
-            executor.shutdown(wait=False, cancel_futures=True)
+            _shutdownCombineExecutor(wait=False, cancel_futures=True)
             log.info("Shutdown complete.")
             raise
-        finally:
-            # Only wait for graceful shutdown if not interrupted
-            if not executor._shutdown:
-                executor.shutdown(wait=True)
 
     # Process any queued conversions from Phase 1
     if len(conversions) > 0:
@@ -1081,10 +1331,21 @@ def recursivelyCombineBatch(offset=0):
 
     # Prompt to continue with next batch
     next_offset = offset + len(books)
+    return _nextBatchOffset(next_offset)
+
+
+def _nextBatchOffset(next_offset):
+    """
+    Offset to continue from once a batch is done, or None to stop.
+    --autoContinue runs every batch unattended; --quick stops after one without asking.
+    """
+    if settings.autoContinue:
+        return next_offset
     if not settings.quick:
         response = input("Process another batch? (y/n): ").strip().lower()
         if response == 'y' or response == 'yes':
-            recursivelyCombineBatch(next_offset)
+            return next_offset
+    return None
 
 
 def recursivelyPreserveBatch():
@@ -1093,10 +1354,19 @@ def recursivelyPreserveBatch():
 
 
 def singleLevelBatch(infolder = None, skipDuplicateSummary = False, offset = 0):
+    while offset is not None:
+        offset = _singleLevelOneBatch(infolder, skipDuplicateSummary, offset)
+
+def _singleLevelOneBatch(infolder, skipDuplicateSummary, offset):
+    """Process one singleLevelBatch batch. Returns the next batch's offset, or None to stop."""
     log.info("Begin single level batch processing")
     log.info("PHASE 1: Auto-fetch only (no user interaction)")
     global deferredBooks
     deferredBooks = []
+    clearFailMarkerCache()
+    clearCoverCache()
+    _claimedBookPaths.clear()
+    _reservedOutputFiles.clear()
 
     if infolder == None:
         infolder = Path(settings.input)
@@ -1104,16 +1374,14 @@ def singleLevelBatch(infolder = None, skipDuplicateSummary = False, offset = 0):
 
     if files == -1 or len(files) == 0:
         log.warning(f"No audio files found in '{infolder}'. Do you need to use -RC or -RF to search subdirectories?")
-        return
+        return None
 
     # Detect and filter duplicate versions before processing
     if isinstance(files, list) and len(files) > 1:
         files = detectDuplicateSingleFiles(files)
 
     total = len(files)
-    for i, file in enumerate(files, 1):
-        setProgress(i, total)
-        processFile(file)
+    _processFiles(files)
 
     if len(conversions) > 0:
         processConversions()
@@ -1136,33 +1404,37 @@ def singleLevelBatch(infolder = None, skipDuplicateSummary = False, offset = 0):
     next_offset = offset + settings.batch
 
     # Prompt to continue with next batch
-    if not settings.quick:
-        response = input("Process another batch? (y/n): ").strip().lower()
-        if response == 'y' or response == 'yes':
-            singleLevelBatch(infolder, skipDuplicateSummary, next_offset)
+    return _nextBatchOffset(next_offset)
 
 
 def recursivelyFetchBatch(offset = 0):    #Since the only difference is passing true to getAudioFiles, I could probably fold this into another batch
+    while offset is not None:
+        offset = _recursivelyFetchOneBatch(offset)
+
+def _recursivelyFetchOneBatch(offset):
+    """Process one recursivelyFetchBatch batch. Returns the next batch's offset, or None to stop."""
     log.info("Begin processing complete books in all subdirectories (recursively fetch batch)")
     log.info("PHASE 1: Auto-fetch only (no user interaction)")
     global deferredBooks
     deferredBooks = []
+    clearFailMarkerCache()
+    clearCoverCache()
+    _claimedBookPaths.clear()
+    _reservedOutputFiles.clear()
 
     infolder = Path(settings.input)
     files = getAudioFiles(infolder, settings.batch, recurse=True, offset=offset)
 
     if files == -1 or len(files) == 0:
         log.info("No more files to process.")
-        return
+        return None
 
     # Detect and filter duplicate versions before processing
     if isinstance(files, list) and len(files) > 1:
         files = detectDuplicateSingleFiles(files)
 
     total = len(files)
-    for i, file in enumerate(files, 1):
-        setProgress(i, total)
-        processFile(file)
+    _processFiles(files)
 
     if len(conversions) > 0:
         processConversions()
@@ -1184,9 +1456,4 @@ def recursivelyFetchBatch(offset = 0):    #Since the only difference is passing
     next_offset = offset + settings.batch
 
     # Prompt to continue with next batch
-    if not settings.quick:
-        response = input("Process another batch? (y/n): ").strip().lower()
-        if response == 'y' or response == 'yes':
-            recursivelyFetchBatch(next_offset)
-
-    return
\ No newline at end of file
+    return _nextBatchOffset(next_offset)
\ No newline at end of file
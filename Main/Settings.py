@@ -3,12 +3,15 @@ import logging
 from pathlib import Path
 import sys
 import re
-import os
 
 log = logging.getLogger(__name__)
 
 settings = None
 
+# Special characters rejected by checkFolders
+_INPUT_SPECIALS = re.compile(r'[<>"|?*\x00-\x1F]')
+_OUTPUT_SPECIALS = re.compile(r'[<,>"|?*\x00-\x1F]')
+
 def _write_to_log_file(message):
     """Write directly to file handler only, bypassing console output."""
     import logging
@@ -77,11 +80,8 @@ class Settings:
 
     def createSaveFile(self): 
         log.debug("Saving settings")
-        settingsMap = self.__dict__
-        settingsJSON = json.dumps(settingsMap)
-
         with open ('settings.json', 'w') as outFile:
-            outFile.write(settingsJSON)
+            json.dump(self.__dict__, outFile)
 
     def confirm(self):
         log.debug("Confirming settings")
@@ -101,20 +101,16 @@ class Settings:
         # Apostrophes (both straight ' and curly ') are now handled via escaping in ffmpeg concat files
         # Input paths can have commas (common in multi-author folder names)
         # Output paths should not have commas (we control the output structure)
-        inputSpecials = re.compile(r'[<>"|?*\x00-\x1F]')  # Allow commas in input paths
-        outputSpecials = re.compile(r'[<,>"|?*\x00-\x1F]')  # Disallow commas in output paths
-        inDirs = self.input.split(os.sep)
-        outDirs = self.output.split(os.sep)
-
-        for folder in inDirs:
-            if inputSpecials.search(folder):
-                log.error("ERROR: special character detected in input directory: " + str(folder) + \
-                    ". Special characters can cause unexpected behavior and are not allowed. Aborting...")
+        # Path.parts splits on either separator on Windows, where os.sep alone missed '/'
+        for folder in Path(self.input).parts:
+            if _INPUT_SPECIALS.search(folder):
+                log.error("ERROR: special character detected in input directory: %s"
+                    ". Special characters can cause unexpected behavior and are not allowed. Aborting...", folder)
                 sys.exit(1)
-        for folder in outDirs:
-            if outputSpecials.search(folder):
-                log.error("ERROR: special character detected in output directory: " + str(folder) + \
-                    ". Special characters can cause unexpected behavior and are not allowed. Aborting...")
+        for folder in Path(self.output).parts:
+            if _OUTPUT_SPECIALS.search(folder):
+                log.error("ERROR: special character detected in output directory: %s"
+                    ". Special characters can cause unexpected behavior and are not allowed. Aborting...", folder)
                 sys.exit(1)
         
         